@@ -16,7 +16,7 @@
 from mitiq._about import about
 from mitiq._typing import QPROGRAM
 from mitiq._version import __version__
-from mitiq.collector import generate_collected_executor
+from mitiq.collector import batched_executor, generate_collected_executor
 from mitiq._deprecations import (
     execute_with_zne,
     mitigate_executor,
@@ -19,6 +19,7 @@ by error mitigation techniques to compute expectation values."""
 from collections import Counter
 import inspect
 from typing import Any, Callable, Iterable, List, Sequence, Tuple, Union
+import weakref
 
 import numpy as np
 
@@ -45,8 +46,9 @@ def generate_collected_executor(
             executor inputs a list of quantum circuits and outputs a list of
             expectation values (one for each circuit).
 
-            An executor is detected as batched if and only if it is annotated
-            with a return type that is one of the following:
+            An executor is detected as batched if and only if it is decorated
+            with :func:`batched_executor` or it is annotated with a return
+            type that is one of the following:
 
             * Iterable[float]
             * List[float]
@@ -73,6 +75,28 @@ def generate_collected_executor(
     return collected
 
 
+def batched_executor(executor: Callable) -> Callable:
+    """Decorator which marks the input function as a "batched executor",
+    i.e., a function which inputs a sequence of quantum programs and outputs
+    a sequence of expectation values (one for each program). Decorated
+    executors are detected as batched independently of their return type
+    annotation.
+
+    Example:
+        >>> @batched_executor
+        ... def executor(circuits):
+        ...     return [0.0] * len(circuits)
+
+    Args:
+        executor: The batched executor function.
+
+    Returns:
+        The same executor, marked as batched.
+    """
+    executor._mitiq_batched = True  # type: ignore
+    return executor
+
+
 class Collector:
     """Tool for efficiently scheduling/executing quantum programs and
     collecting the results.
@@ -180,8 +204,9 @@ class Collector:
         """Returns True if the input function is recognized as a "batched
         executor", else False.
 
-        The executor is detected as "batched" if and only if it is annotated
-        with a return type that is one of the following:
+        The executor is detected as "batched" if and only if it is decorated
+        with :func:`batched_executor` or it is annotated with a return type
+        that is one of the following:
 
             * Iterable[float]
             * List[float]
@@ -203,12 +228,43 @@ class Collector:
         Returns:
             True if the executor is detected as batched, else False.
         """
-        executor_annotation = inspect.getfullargspec(executor).annotations
-
-        return executor_annotation.get("return") in (
-            List[float],
-            Sequence[float],
-            Tuple[float],
-            Iterable[float],
-            np.ndarray,
-        )
+        is_batched = getattr(executor, "_mitiq_batched", None)
+        if is_batched is not None:
+            return bool(is_batched)
+
+        return _has_batched_return_annotation(executor)
+
+
+# Results of _has_batched_return_annotation. The executors are weakly
+# referenced, so that the cache does not keep them (and their backends) alive.
+_batched_annotation_cache: "weakref.WeakKeyDictionary[Callable, bool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _has_batched_return_annotation(executor: Callable) -> bool:
+    """Returns True if the return type annotation of the input function is
+    one of the types recognized for batched executors, else False.
+
+    The result only depends on the input function, so it is cached to avoid
+    inspecting the signature of the same executor at each call.
+    """
+    try:
+        return _batched_annotation_cache[executor]
+    except (KeyError, TypeError):
+        # TypeError: the executor is unhashable or not weakly referenceable
+        pass
+
+    return_annotation = inspect.signature(executor).return_annotation
+    is_batched = return_annotation in (
+        List[float],
+        Sequence[float],
+        Tuple[float],
+        Iterable[float],
+        np.ndarray,
+    )
+    try:
+        _batched_annotation_cache[executor] = is_batched
+    except TypeError:
+        pass
+    return is_batched
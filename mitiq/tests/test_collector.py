@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 """Unit tests for Collector."""
+import gc
 import pytest
 from typing import List
 
@@ -22,7 +23,13 @@ import numpy as np
 import cirq
 import pyquil
 
-from mitiq.collector import Collector, generate_collected_executor
+from mitiq.collector import (
+    Collector,
+    batched_executor,
+    generate_collected_executor,
+    _batched_annotation_cache,
+    _has_batched_return_annotation,
+)
 
 
 def executor_batched(circuits, **kwargs) -> np.ndarray:
@@ -69,6 +76,40 @@ def test_collector_is_batched_executor():
     assert not Collector.is_batched_executor(executor=executor_serial)
 
 
+def test_collector_is_batched_executor_with_decorator():
+    @batched_executor
+    def executor(circuits):
+        return [0.0] * len(circuits)
+
+    assert Collector.is_batched_executor(executor=executor)
+    assert Collector(executor=executor).can_batch
+
+
+def test_collector_is_batched_executor_is_cached():
+    def executor(circuits) -> List[float]:
+        return [0.0] * len(circuits)
+
+    assert Collector.is_batched_executor(executor=executor)
+    assert _batched_annotation_cache[executor]
+    assert Collector.is_batched_executor(executor=executor)
+
+    # The cache does not keep the executor alive
+    num_cached = len(_batched_annotation_cache)
+    del executor
+    gc.collect()
+    assert len(_batched_annotation_cache) == num_cached - 1
+
+    # Executors which cannot be weakly referenced are not cached
+    class SlottedExecutor:
+        __slots__ = ()
+
+        def __call__(self, circuits) -> List[float]:
+            return [0.0] * len(circuits)
+
+    assert _has_batched_return_annotation(SlottedExecutor())
+    assert len(_batched_annotation_cache) == num_cached - 1
+
+
 @pytest.mark.parametrize("ncircuits", (5, 10, 25))
 @pytest.mark.parametrize("executor", (executor_batched, executor_serial))
 def test_run_collector_identical_circuits_batched(ncircuits, executor):
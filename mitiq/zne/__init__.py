@@ -24,4 +24,5 @@ from mitiq.zne.inference import (
     ExpFactory,
     PolyExpFactory,
     AdaExpFactory,
+    use_numba,
 )
@@ -15,7 +15,9 @@
 
 """Classes corresponding to different zero-noise extrapolation methods."""
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from functools import lru_cache
+import inspect
+import math
 from typing import (
     Any,
     Callable,
@@ -25,18 +27,23 @@ from typing import (
     Sequence,
     Tuple,
     Union,
+    TYPE_CHECKING,
+    cast,
 )
 import warnings
 
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 import numpy as np
-from numpy.lib.polynomial import RankWarning
-from scipy.optimize import curve_fit, OptimizeWarning
+from scipy.linalg import lstsq
+from scipy.optimize import least_squares
+from scipy.special import comb
 
 from mitiq import QPROGRAM
 from mitiq.collector import Collector
 
+# Matplotlib is only imported when plotting, since importing it is slow
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 class ExtrapolationError(Exception):
     """Error raised by :class:`.Factory` objects when
@@ -84,12 +91,16 @@ class ConvergenceWarning(Warning):
 
 def mitiq_curve_fit(
     ansatz: Callable[..., float],
-    scale_factors: Sequence[float],
-    exp_values: Sequence[float],
+    scale_factors: Union[Sequence[float], np.ndarray],
+    exp_values: Union[Sequence[float], np.ndarray],
     init_params: Optional[List[float]] = None,
-) -> Tuple[List[float], np.ndarray]:
+    jac: Optional[Callable[..., np.ndarray]] = None,
+    ftol: float = 1.0e-8,
+    xtol: float = 1.0e-8,
+) -> Tuple[np.ndarray, np.ndarray]:
     """Fits the ansatz to the (scale factor, expectation value) data using
-    ``scipy.optimize.curve_fit``, returning the optimal parameters and
+    ``scipy.optimize.least_squares`` (Levenberg-Marquardt method with
+    Jacobian-based parameter scaling), returning the optimal parameters and
     covariance matrix of the parameters.
 
     Args:
@@ -99,45 +110,81 @@ def mitiq_curve_fit(
         scale_factors: The array of noise scale factors.
         exp_values: The array of expectation values.
         init_params: Initial guess for the parameters. If None, the initial
-            values are set to 1.
+            values are set to 1 and the number of parameters is deduced from
+            the signature of the ansatz.
+        jac: Optional function with the same signature of the ansatz which
+            returns the Jacobian matrix of the ansatz with respect to the
+            parameters, with shape (len(scale_factors), len(init_params)).
+            If None, the Jacobian is estimated numerically.
+        ftol: Relative tolerance for the change of the sum of squares.
+        xtol: Relative tolerance for the change of the parameters.
 
     Returns:
         The array of optimal parameters and the covariance matrix of the
-        parameters. If the fit is ill-conditioned, the covariance matrix may
-        contain np.inf elements.
+        parameters. If there are as many data points as parameters, the
+        covariance matrix cannot be estimated and its elements are np.inf.
 
     Raises:
+        TypeError: If there are more parameters than data points.
         ExtrapolationError: If the extrapolation fit fails.
-        ExtrapolationWarning: If the extrapolation fit is ill-conditioned.
+        ExtrapolationWarning: If the covariance matrix cannot be estimated.
     """
-    try:
-        with warnings.catch_warnings(record=True) as warn_list:
-            opt_params, params_cov = curve_fit(
-                ansatz, scale_factors, exp_values, p0=init_params
-            )
-        for warn in warn_list:
-            # replace OptimizeWarning with ExtrapolationWarning
-            if warn.category is OptimizeWarning:
-                warn.category = ExtrapolationWarning
-                warn.message = _EXTR_WARN  # type: ignore
-            # re-raise all warnings
-            warnings.warn_explicit(
-                warn.message, warn.category, warn.filename, warn.lineno
-            )
-    except RuntimeError:
-        raise ExtrapolationError(_EXTR_ERR) from None
-    return list(opt_params), params_cov
+    scale_arr = np.asarray(scale_factors, dtype=np.float64)
+    exp_arr = np.asarray(exp_values, dtype=np.float64)
+    if init_params is None:
+        num_params = len(inspect.signature(ansatz).parameters) - 1
+        init_params = [1.0] * num_params
+    if len(init_params) > len(exp_arr):
+        # Same error raised by scipy.optimize.curve_fit
+        raise TypeError(
+            f"The number of func parameters={len(init_params)} must not "
+            f"exceed the number of data points={len(exp_arr)}"
+        )
+
+    def residuals(params: np.ndarray) -> np.ndarray:
+        return ansatz(scale_arr, *params) - exp_arr
+
+    def residuals_jac(params: np.ndarray) -> np.ndarray:
+        return jac(scale_arr, *params)  # type: ignore
+
+    res = least_squares(
+        residuals,
+        x0=np.asarray(init_params, dtype=np.float64),
+        jac="2-point" if jac is None else residuals_jac,
+        method="lm",
+        x_scale="jac",
+        ftol=ftol,
+        xtol=xtol,
+    )
+    if not res.success:
+        raise ExtrapolationError(_EXTR_ERR)
+
+    # Estimate the covariance matrix as done by scipy.optimize.curve_fit,
+    # with the Moore-Penrose inverse of the Jacobian discarding its zero
+    # singular values
+    num_points, num_params = res.jac.shape
+    _, sing_vals, vt = np.linalg.svd(res.jac, full_matrices=False)
+    threshold = np.finfo(np.float64).eps * max(res.jac.shape) * sing_vals[0]
+    nonzero = sing_vals > threshold
+    params_cov = (vt[nonzero].T / sing_vals[nonzero] ** 2) @ vt[nonzero]
+    if num_points > num_params and not np.isnan(params_cov).any():
+        params_cov *= 2 * res.cost / (num_points - num_params)
+    else:
+        params_cov = np.full((num_params, num_params), np.inf)
+        warnings.warn(_EXTR_WARN, ExtrapolationWarning)
+
+    return res.x, params_cov
 
 
 def mitiq_polyfit(
-    scale_factors: Sequence[float],
-    exp_values: Sequence[float],
+    scale_factors: Union[Sequence[float], np.ndarray],
+    exp_values: Union[Sequence[float], np.ndarray],
     deg: int,
-    weights: Optional[Sequence[float]] = None,
-) -> Tuple[List[float], Optional[np.ndarray]]:
-    """Fits the ansatz to the (scale factor, expectation value) data using
-    ``numpy.polyfit``, returning the optimal parameters and covariance matrix
-    of the parameters.
+    weights: Optional[Union[Sequence[float], np.ndarray]] = None,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Fits a polynomial to the (scale factor, expectation value) data with
+    the same least squares method of ``numpy.polyfit``, returning the optimal
+    parameters and covariance matrix of the parameters.
 
     Args:
         scale_factors: The array of noise scale factors.
@@ -147,33 +194,452 @@ def mitiq_polyfit(
             This is used to make a weighted least squares fit.
 
     Returns:
-        The optimal parameters and covariance matrix of the parameters.
-        If there is not enough data to estimate the covariance matrix, it is
-        returned as None.
+        The array of optimal parameters and the covariance matrix of the
+        parameters. If there is not enough data to estimate the covariance
+        matrix, it is returned as None.
 
     Raises:
+        ValueError: If the degree is negative.
+        TypeError: If there are no scale factors or if the number of scale
+            factors and expectation values is different.
         ExtrapolationWarning: If the extrapolation fit is ill-conditioned.
     """
+    # Weighted least squares fit solved as in numpy.polyfit. The rank of the
+    # problem is checked directly, so that an ExtrapolationWarning can be
+    # raised without recording and translating the RankWarning of numpy.
+    scale_arr = np.asarray(scale_factors, dtype=np.float64)
+    rhs = _exp_values_array(exp_values)
+    _check_polyfit_data(scale_arr, rhs, deg)
+    lhs = _vandermonde(tuple(scale_arr.tolist()), deg)
+    if weights is not None:
+        weights_arr = np.asarray(weights, dtype=np.float64)
+        lhs = lhs * weights_arr[:, None]
+        rhs = rhs * weights_arr
+    # Scale the columns to improve the conditioning
+    scale = np.sqrt((lhs * lhs).sum(axis=0))
+    scale[scale == 0] = 1.0
+    lhs = lhs / scale
+
+    # For these small systems, a QR factorization with column pivoting
+    # (LAPACK gelsy) is faster than the SVD used by np.linalg.lstsq
+    rcond = len(scale_factors) * np.finfo(np.float64).eps
+    coeffs, _, rank, _ = lstsq(
+        lhs, rhs, cond=rcond, lapack_driver="gelsy", check_finite=False
+    )
+    opt_params = coeffs / scale
+
+    params_cov = None
+    if rank != deg + 1:
+        warnings.warn(_EXTR_WARN, ExtrapolationWarning)
+    elif len(scale_factors) > deg + 1:
+        # The gelsy driver does not return the sum of squared residuals
+        residuals = rhs - lhs @ coeffs
+        dof = len(scale_factors) - (deg + 1)
+        params_cov = np.linalg.inv(lhs.T @ lhs) / np.outer(scale, scale)
+        params_cov *= np.vdot(residuals, residuals).real / dof
+
+    return opt_params, params_cov
+
+
+@lru_cache(maxsize=64)
+def _vandermonde(scale_factors: Tuple[float, ...], deg: int) -> np.ndarray:
+    """Returns the read-only Vandermonde matrix of the input scale factors,
+    with the powers of x ordered from high to low as in ``np.vander``. It is
+    cached since adaptive fits often repeat the same scale factors.
 
-    with warnings.catch_warnings(record=True) as warn_list:
-        try:
-            opt_params, params_cov = np.polyfit(
-                scale_factors, exp_values, deg, w=weights, cov=True
-            )
-        except (ValueError, np.linalg.LinAlgError):
-            opt_params = np.polyfit(scale_factors, exp_values, deg, w=weights)
-            params_cov = None
+    Args:
+        scale_factors: The tuple of noise scale factors.
+        deg: The degree of the polynomial fit.
+    """
+    vander = np.vander(np.array(scale_factors, dtype=np.float64), deg + 1)
+    vander.setflags(write=False)
+    return vander
+
+
+def _scaled_vander_svd(
+    x: np.ndarray, deg: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the thin SVD (u, s, vt) of the Vandermonde matrix of x whose
+    columns are normalized, as done by np.polyfit to improve the conditioning,
+    and the array of column norms.
+    """
+    vander = np.vander(x, deg + 1)
+    scale = np.sqrt((vander * vander).sum(axis=0))
+    scale[scale == 0] = 1.0
+    u, s, vt = np.linalg.svd(vander / scale, full_matrices=False)
+    return u, s, vt, scale
+
+
+@lru_cache(maxsize=64)
+def _vandermonde_pinv(
+    scale_factors: Tuple[float, ...], deg: int
+) -> Tuple[np.ndarray, Optional[np.ndarray], bool]:
+    """Returns the pseudoinverse of the Vandermonde matrix associated to the
+    input scale factors, the unscaled covariance matrix (V^T V)^-1 and a flag
+    which is True if the Vandermonde matrix has full rank.
+
+    To improve the conditioning of the problem, the least squares problem is
+    solved for the variable t = alpha * x + beta, which maps the scale factors
+    to the interval [-1, 1]. The result is then converted back to the basis
+    of the powers of x, such that applying the pseudoinverse to the data
+    gives the coefficients of the polynomial in x (from high to low powers).
+
+    Since the result depends only on the scale factors and on the degree of
+    the polynomial, it is cached and reused across fits.
+
+    Args:
+        scale_factors: The tuple of noise scale factors.
+        deg: The degree of the polynomial fit.
+    """
+    x = np.array(scale_factors, dtype=np.float64)
+    alpha, beta = 1.0, 0.0
+    if x.size > 0 and np.ptp(x) > 0:
+        alpha = 2.0 / float(np.ptp(x))
+        beta = -1.0 - alpha * float(x.min())
+
+    u, s, vt, scale = _scaled_vander_svd(alpha * x + beta, deg)
+
+    # Ignore singular values below the np.polyfit threshold
+    rcond = len(scale_factors) * np.finfo(np.float64).eps
+    nonzero = s > rcond * s[0]
+    full_rank = bool(np.sum(nonzero) == deg + 1)
+
+    if full_rank:
+        # Change of basis from the coefficients of the powers of t to those
+        # of x: t**k = sum_j binom(k, j) * alpha**j * beta**(k - j) * x**j
+        basis_change = np.zeros((deg + 1, deg + 1))
+        for k in range(deg + 1):
+            for j in range(k + 1):
+                basis_change[j, k] = (
+                    comb(k, j, exact=True) * alpha ** j * beta ** (k - j)
+                )
+        # Order the coefficients from high to low powers, as np.vander does
+        basis_change = basis_change[::-1, ::-1] / scale
+    else:
+        # The minimum norm solution depends on the basis of the polynomials,
+        # so rank-deficient problems are solved in the column-scaled basis of
+        # the powers of x, exactly as np.polyfit does.
+        u, s, vt, scale = _scaled_vander_svd(x, deg)
+        nonzero = s > rcond * s[0]
+        basis_change = np.diag(1.0 / scale)
+
+    s_inv = np.where(nonzero, 1.0 / np.where(nonzero, s, 1.0), 0.0)
+
+    pinv = basis_change @ (vt.T * s_inv) @ u.T
+    pinv.setflags(write=False)
+
+    cov_base = None
+    if full_rank and len(scale_factors) > deg + 1:
+        cov_t = (vt.T * s_inv ** 2) @ vt
+        cov_base = basis_change @ cov_t @ basis_change.T
+        cov_base.setflags(write=False)
+
+    return pinv, cov_base, full_rank
+
+
+def _exp_values_array(
+    exp_values: Union[float, Sequence[float], np.ndarray]
+) -> np.ndarray:
+    """Returns the expectation values as a contiguous array of float64 or,
+    if they are complex, of complex128.
+    """
+    exp_arr = np.asarray(exp_values)
+    return np.ascontiguousarray(
+        exp_arr, dtype=np.result_type(exp_arr, np.float64)
+    )
+
+
+def _check_polyfit_data(
+    scale_factors: np.ndarray, exp_values: np.ndarray, deg: int
+) -> None:
+    """Checks that the input data of a polynomial fit are consistent, raising
+    the same errors as ``numpy.polyfit``.
+
+    Args:
+        scale_factors: The array of noise scale factors.
+        exp_values: The array of expectation values.
+        deg: The degree of the polynomial fit.
 
-    for warn in warn_list:
-        # replace RankWarning with ExtrapolationWarning
-        if warn.category is RankWarning:
-            warn.category = ExtrapolationWarning
-            warn.message = _EXTR_WARN  # type: ignore
-        # re-raise all warnings
-        warnings.warn_explicit(
-            warn.message, warn.category, warn.filename, warn.lineno
+    Raises:
+        ValueError: If the degree is negative.
+        TypeError: If there are no scale factors or if the number of scale
+            factors and expectation values is different.
+    """
+    if deg < 0:
+        raise ValueError("expected deg >= 0")
+    if len(scale_factors) == 0:
+        raise TypeError("expected non-empty vector for x")
+    if len(scale_factors) != len(exp_values):
+        raise TypeError("expected x and y to have same length")
+
+
+def _linear_fit(
+    scale_factors: np.ndarray, exp_values: np.ndarray, with_cov: bool = True
+) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """Returns the optimal parameters [slope, intercept] and their covariance
+    matrix of a linear least squares fit, evaluated in closed form.
+
+    If there is not enough data to estimate the covariance matrix, it is
+    returned as None. If the scale factors are (numerically) all equal, the
+    fit is ill-conditioned and None is returned, so that the general
+    polynomial fit can deal with it.
+
+    Args:
+        scale_factors: The array of noise scale factors.
+        exp_values: The array of expectation values.
+        with_cov: If False, the covariance matrix is not evaluated and it is
+            returned as None.
+
+    Note:
+        The input data are assumed to be already checked by the caller with
+        ``_check_polyfit_data``.
+    """
+    num_points = len(scale_factors)
+    # Python scalars are used for the scalar quantities, which is faster than
+    # operating on NumPy scalars for the typically small number of points.
+    # The expectation values, and so the slope and intercept, may be complex.
+    x_mean = float(scale_factors.sum()) / num_points
+    y_mean = exp_values.sum().item() / num_points
+    dx = scale_factors - x_mean
+    dy = exp_values - y_mean
+    sxx = float(dx @ dx)
+    # The rank threshold of the polynomial fit, expressed in terms of sxx
+    eps = num_points * np.finfo(np.float64).eps
+    if sxx <= eps ** 2 * (float(scale_factors @ scale_factors) + num_points):
+        return None
+
+    slope = (dx @ dy).item() / sxx
+    intercept = y_mean - slope * x_mean
+
+    params_cov = None
+    if with_cov and num_points > 2:
+        residuals = dy - slope * dx
+        sigma2 = np.vdot(residuals, residuals).real / (num_points - 2)
+        var_slope = sigma2 / sxx
+        cov_slope_intercept = -x_mean * var_slope
+        var_intercept = sigma2 / num_points + x_mean ** 2 * var_slope
+        params_cov = np.array(
+            [
+                [var_slope, cov_slope_intercept],
+                [cov_slope_intercept, var_intercept],
+            ]
         )
-    return list(opt_params), params_cov
+
+    return np.array([slope, intercept]), params_cov
+
+
+# Largest argument of math.exp which does not overflow
+_MAX_EXP_ARG = math.log(np.finfo(np.float64).max)
+
+
+def _exp(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Returns exp(x). Scalars are evaluated with math.exp, which is much
+    faster than np.exp on a single float. Arrays and arguments which would
+    overflow are left to np.exp, which returns inf in the latter case.
+    """
+    if isinstance(x, float) and x < _MAX_EXP_ARG:
+        return math.exp(x)
+    return np.exp(x)
+
+
+_INSTACK_KEYS = ("scale_factor", "shots")
+
+
+def _check_instack_keys(
+    instack: Sequence[Dict[str, float]], with_shots: Optional[bool] = None
+) -> None:
+    """Checks that the input parameters of a factory contain a scale factor
+    and that the optional "shots" parameter is either always or never present.
+
+    Args:
+        instack: Sequence of dictionaries of input parameters.
+        with_shots: If not None, whether "shots" must be in all dictionaries.
+            Else, this is deduced from the first element of "instack".
+
+    Raises:
+        ValueError: If the input parameters are not valid.
+    """
+    for params in instack:
+        if "scale_factor" not in params:
+            raise ValueError(
+                "The input parameters of a factory must contain the key "
+                f"'scale_factor', but {params} was given."
+            )
+        if with_shots is None:
+            with_shots = "shots" in params
+        if with_shots != ("shots" in params):
+            raise ValueError(
+                "The key 'shots' must be present in either all or none of "
+                "the input parameters of a factory."
+            )
+
+
+def _extra_instack_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the input parameters which are not stored as arrays, i.e.,
+    all the parameters except "scale_factor" and "shots".
+    """
+    return {k: v for k, v in params.items() if k not in _INSTACK_KEYS}
+
+
+def _fit_data_key(
+    scale_factors: np.ndarray,
+    exp_values: np.ndarray,
+    options: Dict[str, Any],
+) -> Tuple[Any, ...]:
+    """Returns a hashable key identifying the input data and options of a
+    fit, such that repeated fits of the same data can be skipped.
+    """
+    return (
+        np.asarray(scale_factors, dtype=np.float64).tobytes(),
+        _exp_values_array(exp_values).tobytes(),
+        tuple(sorted(options.items())),
+    )
+
+
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    """Returns a read-only view of the input array."""
+    view = arr.view()
+    view.setflags(write=False)
+    return view
+
+
+def _exp_ansatz_numpy(
+    x: np.ndarray, asymptote: float, b: float, z_coeffs: np.ndarray
+) -> np.ndarray:
+    """Returns asymptote + b * exp(x * z(x)), where z(x) = z_0 + z_1 * x +
+    z_2 * x**2 + ... has coefficients z_coeffs (from low to high powers of x).
+    """
+    z = np.full(x.shape, z_coeffs[-1])
+    for k in range(len(z_coeffs) - 2, -1, -1):
+        z = z * x + z_coeffs[k]
+    return asymptote + b * np.exp(x * z)
+
+
+def _exp_ansatz_loop(
+    x: np.ndarray, asymptote: float, b: float, z_coeffs: np.ndarray
+) -> np.ndarray:
+    """Same as _exp_ansatz_numpy, but evaluated in a single pass over x
+    without temporary arrays. This is only efficient once compiled with
+    Numba (see use_numba).
+    """
+    result = np.empty_like(x)
+    last = len(z_coeffs) - 1
+    for i in range(x.shape[0]):
+        x_i = x[i]
+        z = z_coeffs[last]
+        for k in range(last - 1, -1, -1):
+            z = z * x_i + z_coeffs[k]
+        result[i] = asymptote + b * np.exp(x_i * z)
+    return result
+
+
+# Kernel of the exponential ansatzes. By default the vectorized NumPy version
+# is used. The fused loop compiled with Numba can be selected with use_numba.
+_exp_ansatz_kernel: Callable[
+    [np.ndarray, float, float, np.ndarray], np.ndarray
+] = _exp_ansatz_numpy
+
+
+def use_numba(enabled: bool = True) -> None:
+    """Selects whether the exponential ansatzes of ExpFactory, PolyExpFactory
+    and AdaExpFactory are evaluated with a kernel compiled by Numba.
+
+    The kernel is compiled at its first call in each process. Together with
+    the import of Numba, this makes the first exponential fit almost one
+    second slower, while each later evaluation of the ansatz saves only a
+    few microseconds. So this is only convenient when hundreds of thousands
+    of evaluations (many exponential fits) are performed in the same
+    process. By default, the NumPy kernel is used.
+
+    Args:
+        enabled: If True, the compiled kernel is used. If False, the default
+            NumPy kernel is restored.
+
+    Raises:
+        ImportError: If enabled is True and Numba is not installed.
+    """
+    global _exp_ansatz_kernel
+    if enabled:
+        from numba import njit
+
+        _exp_ansatz_kernel = njit(_exp_ansatz_loop)
+    else:
+        _exp_ansatz_kernel = _exp_ansatz_numpy
+
+
+def _exp_ansatz(
+    x: Union[float, np.ndarray],
+    asymptote: float,
+    b: float,
+    z_coeffs: Union[Sequence[float], np.ndarray],
+) -> Union[float, np.ndarray]:
+    """Evaluates the exponential ansatz asymptote + b * exp(x * z(x)) for a
+    scalar or an array x, where z(x) is the polynomial with coefficients
+    z_coeffs (from low to high powers of x).
+    """
+    x_arr = np.asarray(x, dtype=np.float64)
+    result = _exp_ansatz_kernel(
+        x_arr.reshape(-1),
+        float(asymptote),
+        float(b),
+        np.asarray(z_coeffs, dtype=np.float64),
+    )
+    if x_arr.ndim == 0:
+        return result[0]
+    return result.reshape(x_arr.shape)
+
+
+def _exp_poly(
+    x: Union[float, np.ndarray], z_coeffs: Union[Sequence[float], np.ndarray]
+) -> Union[float, np.ndarray]:
+    """Evaluates exp(x * z(x)) for a scalar or an array x, where z(x) is the
+    polynomial with coefficients z_coeffs (from low to high powers of x).
+    """
+    return _exp_ansatz(x, 0.0, 1.0, z_coeffs)
+
+
+def _polynomial_curve(
+    coeffs: Union[Sequence[float], np.ndarray]
+) -> Callable[[float], float]:
+    """Returns the polynomial function with coefficients coeffs (from high to
+    low powers of x, as in np.polyval). The function is evaluated with the
+    Horner scheme: in plain Python for scalar inputs and with in-place array
+    operations for array inputs. Both are faster than np.polyval for the low
+    degrees used in zero-noise extrapolation. Linear curves are evaluated
+    directly as slope * x + intercept.
+    """
+    # The coefficients are complex if the fitted expectation values are
+    coeffs_arr = np.asarray(coeffs)
+    coeffs_arr = coeffs_arr.astype(np.result_type(coeffs_arr, np.float64))
+    coeffs_tuple = tuple(coeffs_arr.tolist())
+
+    if len(coeffs_tuple) == 2:
+        slope, intercept = coeffs_tuple
+
+        def linear_curve(
+            x: Union[float, np.ndarray]
+        ) -> Union[float, np.ndarray]:
+            if not np.isscalar(x):
+                return slope * np.asarray(x, dtype=np.float64) + intercept
+            return slope * float(cast(float, x)) + intercept
+
+        return cast(Callable[[float], float], linear_curve)
+
+    def curve(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        if not np.isscalar(x):
+            x_arr = np.asarray(x, dtype=np.float64)
+            values = np.full(x_arr.shape, coeffs_tuple[0])
+            for c in coeffs_tuple[1:]:
+                values *= x_arr
+                values += c
+            return values
+        x_float = float(cast(float, x))
+        result = 0.0
+        for c in coeffs_tuple:
+            result = result * x_float + c
+        return result
+
+    return cast(Callable[[float], float], curve)
 
 
 class Factory(ABC):
@@ -191,46 +657,94 @@ class Factory(ABC):
 
     If the next scale factor depends on the previous history of results,
     jobs are run sequentially. This is handled by an AdaptiveFactory.
+
+    The input parameters of each expectation value (a scale factor and,
+    optionally, a number of shots) are stored as arrays, one per parameter.
+    Any other executor parameters are stored in a list of dictionaries, which
+    is None if no such parameters were given.
     """
 
     def __init__(self) -> None:
-        self._instack: List[Dict[str, float]] = []
-        self._outstack: List[float] = []
-        self._opt_params: Optional[List[float]] = None
+        self._scale_arr = _read_only(np.array([], dtype=np.float64))
+        self._shots_arr: Optional[np.ndarray] = None
+        self._extra_params: Optional[List[Dict[str, Any]]] = None
+        self._outstack: Union[List[float], np.ndarray] = []
+        self._opt_params: Optional[np.ndarray] = None
         self._params_cov: Optional[np.ndarray] = None
         self._zne_limit: Optional[float] = None
         self._zne_error: Optional[float] = None
         self._zne_curve: Optional[Callable[[float], float]] = None
         self._already_reduced = False
         self._options: Dict[str, float] = {}
+        # Key of the data used by the last call to "reduce"
+        self._reduce_key: Optional[Tuple[Any, ...]] = None
+
+    @property
+    def _instack(self) -> List[Dict[str, float]]:
+        """The list of input parameters associated to each expectation value,
+        e.g., [{"scale_factor": 1.0, "shots": 100}, ...]. Since the parameters
+        are stored as arrays, a new list is returned at each call.
+        """
+        if self._shots_arr is None:
+            instack = [{"scale_factor": s} for s in self._scale_arr.tolist()]
+        else:
+            instack = [
+                {"scale_factor": s, "shots": n}
+                for s, n in zip(
+                    self._scale_arr.tolist(), self._shots_arr.tolist()
+                )
+            ]
+        if self._extra_params is not None:
+            for params, extra in zip(instack, self._extra_params):
+                params.update(extra)
+        return instack
+
+    @_instack.setter
+    def _instack(self, instack: List[Dict[str, float]]) -> None:
+        _check_instack_keys(instack)
+        self._scale_arr = _read_only(
+            np.array(
+                [params["scale_factor"] for params in instack],
+                dtype=np.float64,
+            )
+        )
+        self._shots_arr = None
+        if instack and "shots" in instack[0]:
+            self._shots_arr = _read_only(
+                np.array([params["shots"] for params in instack], dtype=int)
+            )
+        extra_params = [_extra_instack_params(params) for params in instack]
+        self._extra_params = None
+        if any(extra_params):
+            self._extra_params = extra_params
 
     def get_scale_factors(self) -> np.ndarray:
         """Returns the scale factors at which the factory has computed
-        expectation values.
+        expectation values. The returned array is read-only.
         """
-        return np.array(
-            [params.get("scale_factor") for params in self._instack]
-        )
+        return self._scale_arr
 
     def get_expectation_values(self) -> np.ndarray:
-        """Returns the expectation values computed by the factory."""
-        return np.array(self._outstack)
+        """Returns the expectation values computed by the factory. The
+        returned array is read-only.
+        """
+        return _read_only(_exp_values_array(self._outstack))
 
     def get_optimal_parameters(self) -> np.ndarray:
         """Returns the optimal model parameters produced by the extrapolation
-        fit.
+        fit. The returned array is read-only.
         """
         if self._opt_params is None:
             raise ValueError(DATA_MISSING_ERR)
-        return np.array(self._opt_params)
+        return _read_only(np.asarray(self._opt_params))
 
     def get_parameters_covariance(self) -> np.ndarray:
         """Returns the covariance matrix of the model parameters produced by
-        the extrapolation fit.
+        the extrapolation fit. The returned array is read-only.
         """
         if self._params_cov is None:
             raise ValueError(DATA_MISSING_ERR)
-        return np.array(self._params_cov)
+        return _read_only(np.asarray(self._params_cov))
 
     def get_zero_noise_limit(self) -> float:
         """Returns the last evaluation of the zero-noise limit
@@ -328,11 +842,34 @@ class Factory(ABC):
                 "to clean the internal state of the factory.",
                 ExtrapolationWarning,
             )
-        self._instack.append(instack_val)
-        self._outstack.append(outstack_val)
+        if len(self._scale_arr) == 0:
+            self._shots_arr = None
+            self._extra_params = None
+            if "shots" in instack_val:
+                self._shots_arr = np.array([], dtype=int)
+        _check_instack_keys([instack_val], self._shots_arr is not None)
+
+        extra = _extra_instack_params(instack_val)
+        if extra and self._extra_params is None:
+            self._extra_params = [{} for _ in range(len(self._scale_arr))]
+        if self._extra_params is not None:
+            self._extra_params.append(extra)
+
+        self._scale_arr = _read_only(
+            np.append(self._scale_arr, instack_val["scale_factor"])
+        )
+        if self._shots_arr is not None:
+            self._shots_arr = _read_only(
+                np.append(self._shots_arr, int(instack_val["shots"]))
+            )
+        if isinstance(self._outstack, np.ndarray):
+            self._outstack = np.append(self._outstack, outstack_val)
+        else:
+            self._outstack.append(outstack_val)
+        self._reduce_key = None
         return self
 
-    def plot_data(self) -> Figure:
+    def plot_data(self) -> "Figure":
         """Returns a figure which is a scatter plot of (x, y) data where x are
         scale factors at which expectation values have been computed, and y are
         the associated expectation values.
@@ -340,6 +877,8 @@ class Factory(ABC):
         Returns:
             fig: A 2D scatter plot described above.
         """
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(7, 5))
         ax = plt.gca()
         plt.plot(
@@ -356,13 +895,15 @@ class Factory(ABC):
         plt.ylabel("Expectation value")
         return fig
 
-    def plot_fit(self) -> Figure:
+    def plot_fit(self) -> "Figure":
         """Returns a figure which plots the experimental data as well as the
         best fit curve.
 
         Returns:
             fig: A figure which plots the best fit curve as well as the data.
         """
+        import matplotlib.pyplot as plt
+
         fig = self.plot_data()
 
         smooth_scale_factors = np.linspace(0, self.get_scale_factors()[-1], 20)
@@ -384,15 +925,62 @@ class Factory(ABC):
     def reset(self) -> "Factory":
         """Resets the internal state of the Factory."""
 
-        self._instack = []
+        self._scale_arr = _read_only(np.array([], dtype=np.float64))
+        self._shots_arr = None
+        self._extra_params = None
         self._outstack = []
         self._opt_params = None
         self._params_cov = None
         self._zne_limit = None
         self._zne_error = None
         self._already_reduced = False
+        self._reduce_key = None
         return self
 
+    def _store_fit_result(
+        self,
+        fit_result: Union[
+            float,
+            Tuple[
+                float,
+                Optional[float],
+                Optional[np.ndarray],
+                Optional[np.ndarray],
+                Optional[Callable[[float], float]],
+            ],
+        ],
+    ) -> float:
+        """Stores the full output of an extrapolation, i.e., the zero-noise
+        limit, its error, the optimal parameters, their covariance matrix and
+        the extrapolation curve, and marks the factory as reduced.
+
+        Args:
+            fit_result: The output of an ``extrapolate`` method called with
+                ``full_output=True``. The union with float matches the return
+                type of ``extrapolate``.
+
+        Returns:
+            The zero-noise limit.
+
+        Raises:
+            TypeError: If fit_result is not the full output of a fit.
+        """
+        if not isinstance(fit_result, tuple):
+            raise TypeError(
+                "Expected the full output of an extrapolation, "
+                f"but {fit_result} was given."
+            )
+        zne_limit = fit_result[0]
+        (
+            self._zne_limit,
+            self._zne_error,
+            self._opt_params,
+            self._params_cov,
+            self._zne_curve,
+        ) = fit_result
+        self._already_reduced = True
+        return zne_limit
+
 
 class BatchedFactory(Factory, ABC):
     """Abstract class of a non-adaptive Factory initialized with a
@@ -442,6 +1030,7 @@ class BatchedFactory(Factory, ABC):
             )
 
         self._scale_factors = scale_factors
+        self._scale_factors_arr = np.asarray(scale_factors, dtype=np.float64)
         self._shot_list = shot_list
 
         super(BatchedFactory, self).__init__()
@@ -454,26 +1043,55 @@ class BatchedFactory(Factory, ABC):
 
     def reduce(self) -> float:
         """Evaluates the zero-noise limit found by fitting according to
-        the factory's extrapolation method.
+        the factory's extrapolation method. If the data and the options of
+        the factory did not change since the last call, the results of the
+        previous fit are returned without fitting again.
 
         Returns:
             The zero-noise limit.
         """
-        (
-            self._zne_limit,
-            self._zne_error,
-            self._opt_params,
-            self._params_cov,
-            self._zne_curve,
-        ) = self.extrapolate(  # type: ignore
-            self.get_scale_factors(),
-            self.get_expectation_values(),
-            full_output=True,
-            **self._options,
+        scale_factors = self.get_scale_factors()
+        exp_values = self.get_expectation_values()
+        key = _fit_data_key(scale_factors, exp_values, self._options)
+        if key == self._reduce_key:
+            self._already_reduced = True
+            return self._zne_limit  # type: ignore
+
+        zne_limit = self._store_fit_result(
+            self.extrapolate(
+                scale_factors, exp_values, full_output=True, **self._options,
+            )
         )
+        self._reduce_key = key
+        return zne_limit
 
-        self._already_reduced = True
-        return self._zne_limit
+    def reduce_fast(self) -> float:
+        """Evaluates only the zero-noise limit, skipping the computation of
+        the other fit results (error, optimal parameters, covariance matrix
+        and extrapolation curve). This is faster than ``reduce`` for factories
+        with a specialized zero-noise limit, e.g., RichardsonFactory.
+
+        The other fit results of previous calls of ``reduce`` are cleared,
+        unless the data did not change since then. To compute them, call
+        ``reduce``.
+
+        Returns:
+            The zero-noise limit.
+        """
+        scale_factors = self.get_scale_factors()
+        exp_values = self.get_expectation_values()
+        key = _fit_data_key(scale_factors, exp_values, self._options)
+        if key == self._reduce_key:
+            self._already_reduced = True
+            return self._zne_limit  # type: ignore
+
+        zne_limit = self.extrapolate(  # type: ignore
+            scale_factors, exp_values, full_output=False, **self._options,
+        )
+        self._store_fit_result((zne_limit, None, None, None, None))
+        # The stored results are not complete, so reduce must fit again
+        self._reduce_key = None
+        return zne_limit
 
     def run(
         self,
@@ -487,8 +1105,8 @@ class BatchedFactory(Factory, ABC):
         circuits are run sequentially. If the executor is batched and returns
         a list of expectation values (one for each circuit), then the circuits
         are sent to the backend as a single job. To detect if an executor is
-        batched, it must be annotated with a return type that is one of the
-        following:
+        batched, it must be decorated with :func:`mitiq.batched_executor` or
+        annotated with a return type that is one of the following:
 
             * Iterable[float]
             * List[float]
@@ -534,10 +1152,11 @@ class BatchedFactory(Factory, ABC):
             ]
 
         # Reshape "res" to have "num_to_average" columns
-        res = np.array(res).reshape((-1, num_to_average))
+        res_arr = _exp_values_array(res).reshape((-1, num_to_average))
 
         # Average the "num_to_average" columns
-        self._outstack = np.average(res, axis=1)
+        self._outstack = np.empty(len(self._scale_factors_arr), res_arr.dtype)
+        np.mean(res_arr, axis=1, out=self._outstack)
 
         return self
 
@@ -547,6 +1166,11 @@ class BatchedFactory(Factory, ABC):
         """Computes expectation values by calling the input function at each
         scale factor.
 
+        If shot_list is None and the input function is batched (i.e., it is
+        decorated with :func:`mitiq.batched_executor` or annotated with a
+        return type like ``numpy.ndarray``, see ``run``), it is called only
+        once with the array of all scale factors.
+
         Args:
             scale_factor_to_expectation_value: Function mapping a noise scale
                 factor to an expectation value. If shot_list is not None,
@@ -554,12 +1178,31 @@ class BatchedFactory(Factory, ABC):
         """
         self.reset()
         self._batch_populate_instack()
+
+        if self._shots_arr is None and Collector.is_batched_executor(
+            scale_factor_to_expectation_value
+        ):
+            self._outstack = _exp_values_array(
+                scale_factor_to_expectation_value(self._scale_factors_arr)
+            )
+            return self
+
         kwargs_list = self._get_keyword_args(num_to_average=1)
 
-        self._outstack = [
-            scale_factor_to_expectation_value(scale_factor, **kwargs)
-            for scale_factor, kwargs in zip(self._scale_factors, kwargs_list)
-        ]
+        # The number of expectation values is known, so preallocate them.
+        # The array is converted to complex if a complex value is returned.
+        outstack = np.empty(len(self._scale_factors_arr))
+        for j, (scale_factor, kwargs) in enumerate(
+            zip(self._scale_factors_arr, kwargs_list)
+        ):
+            exp_value = scale_factor_to_expectation_value(
+                scale_factor, **kwargs
+            )
+            is_complex = isinstance(exp_value, (complex, np.complexfloating))
+            if is_complex and not np.iscomplexobj(outstack):
+                outstack = outstack.astype(np.complex128)
+            outstack[j] = exp_value
+        self._outstack = outstack
 
         return self
 
@@ -577,23 +1220,20 @@ class BatchedFactory(Factory, ABC):
             num_to_average: Number of times to call scale_noise at each scale
                 factor.
         """
-        to_run = []
-        for scale_factor in self.get_scale_factors():
-            for _ in range(num_to_average):
-                to_run.append(scale_noise(circuit, scale_factor))
-        return to_run
+        return [
+            scale_noise(circuit, scale_factor)
+            for scale_factor in np.repeat(
+                self._scale_factors_arr, num_to_average
+            )
+        ]
 
     def _batch_populate_instack(self) -> None:
         """Populates the instack with all computed values."""
+        self._scale_arr = _read_only(self._scale_factors_arr)
+        self._shots_arr = None
+        self._extra_params = None
         if self._shot_list:
-            self._instack = [
-                {"scale_factor": scale, "shots": shots}
-                for scale, shots in zip(self._scale_factors, self._shot_list)
-            ]
-        else:
-            self._instack = [
-                {"scale_factor": scale} for scale in self._scale_factors
-            ]
+            self._shots_arr = _read_only(np.array(self._shot_list, dtype=int))
 
     def _get_keyword_args(self, num_to_average: int) -> List[Dict[str, Any]]:
         """Returns a list of keyword dictionaries to be used for
@@ -607,12 +1247,24 @@ class BatchedFactory(Factory, ABC):
         Returns:
             The output list of keyword dictionaries.
         """
-        params = deepcopy(self._instack)
-        for d in params:
-            _ = d.pop("scale_factor")
+        if self._extra_params is not None:
+            # Repeat the stored parameters, except the scale factors
+            return [
+                {k: v for k, v in params.items() if k != "scale_factor"}
+                for params in self._instack
+                for _ in range(num_to_average)
+            ]
+
+        if self._shots_arr is None:
+            # No keyword arguments other than the scale factors
+            return [{}] * (len(self._scale_arr) * num_to_average)
 
         # Repeat each keyword num_to_average times
-        return [k for k in params for _ in range(num_to_average)]
+        return [
+            {"shots": shots}
+            for shots in self._shots_arr.tolist()
+            for _ in range(num_to_average)
+        ]
 
 
 class AdaptiveFactory(Factory, ABC):
@@ -666,10 +1318,12 @@ class AdaptiveFactory(Factory, ABC):
         counter = 0
         while not self.is_converged() and counter < max_iterations:
             next_in_params = self.next()
-            next_exec_params = deepcopy(next_in_params)
 
-            # Get next scale factor and remove it from next_exec_params
-            scale_factor = next_exec_params.pop("scale_factor")
+            # Get next scale factor and the remaining executor parameters
+            scale_factor = next_in_params["scale_factor"]
+            next_exec_params = {
+                k: v for k, v in next_in_params.items() if k != "scale_factor"
+            }
             next_expval = scale_factor_to_expectation_value(
                 scale_factor, **next_exec_params
             )
@@ -765,8 +1419,8 @@ class PolyFactory(BatchedFactory):
 
     @staticmethod
     def extrapolate(
-        scale_factors: Sequence[float],
-        exp_values: Sequence[float],
+        scale_factors: Union[Sequence[float], np.ndarray],
+        exp_values: Union[Sequence[float], np.ndarray],
         order: int,
         full_output: bool = False,
     ) -> Union[
@@ -774,7 +1428,7 @@ class PolyFactory(BatchedFactory):
         Tuple[
             float,
             Optional[float],
-            List[float],
+            np.ndarray,
             Optional[np.ndarray],
             Callable[[float], float],
         ],
@@ -806,10 +1460,32 @@ class PolyFactory(BatchedFactory):
             parameters. To compute the zero-noise limit from the Factory
             parameters, use the ``reduce`` method.
         """
+        scale_arr = np.ascontiguousarray(scale_factors, dtype=np.float64)
+        exp_arr = _exp_values_array(exp_values)
+        _check_polyfit_data(scale_arr, exp_arr, order)
+        linear_fit = None
+        if order == 1:
+            linear_fit = _linear_fit(scale_arr, exp_arr)
+
+        if linear_fit is not None:
+            opt_params, params_cov = linear_fit
+        else:
+            # The fit is linear in the coefficients, so it is obtained by
+            # applying the (cached) pseudoinverse of the Vandermonde matrix
+            # to the data.
+            vander_pinv, cov_base, full_rank = _vandermonde_pinv(
+                tuple(scale_arr.tolist()), order
+            )
+            if not full_rank:
+                warnings.warn(_EXTR_WARN, ExtrapolationWarning)
 
-        opt_params, params_cov = mitiq_polyfit(
-            scale_factors, exp_values, order
-        )
+            opt_params = vander_pinv @ exp_arr
+            params_cov = None
+            if cov_base is not None:
+                residuals = exp_arr - np.polyval(opt_params, scale_arr)
+                dof = len(exp_arr) - (order + 1)
+                rss = np.vdot(residuals, residuals).real
+                params_cov = cov_base * rss / dof
 
         zne_limit = opt_params[-1]
 
@@ -822,11 +1498,60 @@ class PolyFactory(BatchedFactory):
             if params_cov.shape == (order + 1, order + 1):
                 zne_error = np.sqrt(params_cov[order, order])
 
-        def zne_curve(scale_factor: float) -> float:
-            return np.polyval(opt_params, scale_factor)
+        zne_curve = _polynomial_curve(opt_params)
 
         return zne_limit, zne_error, opt_params, params_cov, zne_curve
 
+    @staticmethod
+    def extrapolate_batch(
+        scale_factors: Sequence[float],
+        exp_values: Union[Sequence[Sequence[float]], np.ndarray],
+        order: int,
+    ) -> np.ndarray:
+        """Static method which evaluates the polynomial extrapolation to the
+        zero-noise limit of many sets of expectation values measured at the
+        same noise scale factors, e.g., the expectation values of different
+        observables.
+
+        All the fits share the same Vandermonde matrix, so they are solved
+        together with a single matrix product instead of one fit per set.
+
+        Args:
+            scale_factors: The array of noise scale factors.
+            exp_values: The 2D array of expectation values. Each column is
+                a set of expectation values, with one row per scale factor.
+                For example, the expectation values of several factories
+                with the same scale factors can be stacked with
+                ``np.column_stack([f.get_expectation_values() for f in fs])``.
+            order: The extrapolation order (degree of the polynomial fit).
+
+        Returns:
+            The array of extrapolated zero-noise limits, one per column of
+            ``exp_values``. Each limit is equal to the one returned by
+            ``PolyFactory.extrapolate`` for the corresponding column.
+
+        Raises:
+            ValueError: If the shape of exp_values is not consistent with
+                the number of scale factors.
+            ExtrapolationWarning: If the extrapolation fit is ill-conditioned.
+        """
+        exp_values = np.asarray(exp_values, dtype=np.float64)
+        if exp_values.ndim != 2 or exp_values.shape[0] != len(scale_factors):
+            raise ValueError(
+                "The argument 'exp_values' must be a 2D array with one row "
+                f"per scale factor, but its shape is {exp_values.shape}."
+            )
+
+        vander_pinv, _, full_rank = _vandermonde_pinv(
+            tuple(np.asarray(scale_factors, dtype=np.float64)), order
+        )
+        if not full_rank:
+            warnings.warn(_EXTR_WARN, ExtrapolationWarning)
+
+        # Only the constant coefficient (the last row of the pseudoinverse)
+        # is needed to evaluate the zero-noise limits.
+        return vander_pinv[-1] @ exp_values
+
 
 class RichardsonFactory(BatchedFactory):
     """Factory object implementing Richardson extrapolation.
@@ -847,15 +1572,15 @@ class RichardsonFactory(BatchedFactory):
 
     @staticmethod
     def extrapolate(
-        scale_factors: Sequence[float],
-        exp_values: Sequence[float],
+        scale_factors: Union[Sequence[float], np.ndarray],
+        exp_values: Union[Sequence[float], np.ndarray],
         full_output: bool = False,
     ) -> Union[
         float,
         Tuple[
             float,
             Optional[float],
-            List[float],
+            np.ndarray,
             Optional[np.ndarray],
             Callable[[float], float],
         ],
@@ -885,12 +1610,53 @@ class RichardsonFactory(BatchedFactory):
             parameters. To compute the zero-noise limit from the Factory
             parameters, use the ``reduce`` method.
         """
+        scale_arr = np.ascontiguousarray(scale_factors, dtype=np.float64)
+        exp_arr = _exp_values_array(exp_values)
         # Richardson extrapolation is a particular case of a polynomial fit
         # with order equal to the number of data points minus 1.
-        order = len(scale_factors) - 1
-        return PolyFactory.extrapolate(
-            scale_factors, exp_values, order, full_output
-        )
+        order = len(scale_arr) - 1
+        _check_polyfit_data(scale_arr, exp_arr, order)
+        if not full_output:
+            # The interpolating polynomial evaluated at zero noise is a
+            # linear combination of the expectation values.
+            weights = RichardsonFactory._lagrange_weights_at_zero(
+                tuple(scale_arr.tolist())
+            )
+            if weights is not None:
+                return (weights @ exp_arr).item()
+
+        return PolyFactory.extrapolate(scale_arr, exp_arr, order, full_output)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _lagrange_weights_at_zero(
+        scale_factors: Tuple[float, ...]
+    ) -> Optional[np.ndarray]:
+        """Returns the weights w_k = prod_{j != k} x_j / (x_j - x_k) of the
+        Lagrange polynomials evaluated at zero noise, such that the Richardson
+        zero-noise limit is sum_k w_k * y_k.
+
+        Since the weights depend only on the scale factors, they are cached
+        and reused across extrapolations.
+
+        Args:
+            scale_factors: The tuple of noise scale factors.
+
+        Returns:
+            The read-only array of weights, or None if the scale factors are
+            not all distinct and the interpolation problem is singular.
+        """
+        x = np.array(scale_factors, dtype=np.float64)
+        if len(np.unique(x)) != len(x):
+            return None
+        # differences[k, j] = x_j - x_k, with ones on the diagonal
+        differences = x[None, :] - x[:, None]
+        np.fill_diagonal(differences, 1.0)
+        ratios = x[None, :] / differences
+        np.fill_diagonal(ratios, 1.0)
+        weights = np.prod(ratios, axis=1)
+        weights.setflags(write=False)
+        return weights
 
 
 class FakeNodesFactory(BatchedFactory):
@@ -924,29 +1690,32 @@ class FakeNodesFactory(BatchedFactory):
 
     @staticmethod
     def extrapolate(
-        scale_factors: Sequence[float],
-        exp_values: Sequence[float],
+        scale_factors: Union[Sequence[float], np.ndarray],
+        exp_values: Union[Sequence[float], np.ndarray],
         full_output: bool = False,
     ) -> Union[
         float,
         Tuple[
             float,
             Optional[float],
-            List[float],
+            np.ndarray,
             Optional[np.ndarray],
             Callable[[float], float],
         ],
     ]:
+        scale_arr = np.ascontiguousarray(scale_factors, dtype=np.float64)
 
-        if not FakeNodesFactory._is_equally_spaced(scale_factors):
+        if not FakeNodesFactory._is_equally_spaced(scale_arr):
             raise ValueError("The scale factors must be equally spaced.")
 
         # Define interval [a, b] for which the scale_factors are mapped to
         a = 0.0
-        b = min(scale_factors) + max(scale_factors)
+        b = float(scale_arr.min() + scale_arr.max())
 
         # Mapping to the fake nodes
-        fake_nodes = FakeNodesFactory._map_to_fake_nodes(scale_factors, a, b)
+        fake_nodes = np.asarray(
+            FakeNodesFactory._map_to_fake_nodes(scale_arr, a, b)
+        )
 
         if not full_output:
             return RichardsonFactory.extrapolate(fake_nodes, exp_values)
@@ -961,18 +1730,20 @@ class FakeNodesFactory(BatchedFactory):
 
         # Convert zne_curve from the "fake node space" to the real space.
         # Note: since a=0.0, this conversion is not necessary for zne_limit.
-        def new_curve(scale_factor: float) -> float:
-            """Get real zne_cruve from the curve based on fake nodes."""
+        def new_curve(
+            scale_factor: float, a: float = a, b: float = b
+        ) -> float:
+            """Get real zne_curve from the curve based on fake nodes."""
             return zne_curve(
                 FakeNodesFactory._map_to_fake_nodes(scale_factor, a, b)
             )
 
-        return zne_limit, zne_error, opt_params, params_cov, zne_curve
+        return zne_limit, zne_error, opt_params, params_cov, new_curve
 
     @staticmethod
     def _map_to_fake_nodes(
-        x: Union[Sequence[float], float], a: float, b: float
-    ) -> Sequence[float]:
+        x: Union[Sequence[float], np.ndarray, float], a: float, b: float
+    ) -> Union[np.ndarray, float]:
         """
         A function that maps inputs to Chebyshev-Lobatto points. Based on
         the function [De2020polynomial]_:
@@ -987,7 +1758,8 @@ class FakeNodesFactory(BatchedFactory):
             a: A float representing the interval starting at a
             b: A float representing the interval ending at b
         Returns:
-            A new sequence of fake nodes (Chebyshev-Lobatto points).
+            A new array of fake nodes (Chebyshev-Lobatto points), or a single
+            fake node if x is a scalar.
 
         .. [De2020polynomial]: S.De Marchia. F. Marchetti, E.Perracchionea
             and D.Poggialia,
@@ -996,23 +1768,30 @@ class FakeNodesFactory(BatchedFactory):
             (https://www.sciencedirect.com/science/article/abs/pii/S0377042719303449).
         """
 
-        # The mapping function
-        def S(x):
-            return (a - b) / 2 * np.cos(np.pi * (x - a) / (b - a)) + (
-                a + b
-            ) / 2
+        # The mapping function is applied to all the values at once
+        half_diff = 0.5 * (a - b)
+        half_sum = 0.5 * (a + b)
+        inv_span = np.pi / (b - a)
+        x_arr = np.asarray(x, dtype=np.float64)
+        result = half_diff * np.cos(inv_span * (x_arr - a)) + half_sum
 
-        if isinstance(x, float):
-            return S(x)
-
-        return np.array([S(y) for y in x])
+        if result.ndim == 0:
+            return float(result)
+        return result
 
     @staticmethod
-    def _is_equally_spaced(arr: Sequence[float]) -> bool:
+    def _is_equally_spaced(arr: Union[Sequence[float], np.ndarray]) -> bool:
         """Checks if the sequence is equally spaced."""
 
-        diff_arr = np.diff(np.sort(arr))
-        return np.allclose(diff_arr, diff_arr[0])
+        diff_arr = np.diff(np.asarray(arr, dtype=np.float64))
+        # Sorting is only needed if the sequence is not monotonic
+        if not (np.all(diff_arr > 0) or np.all(diff_arr < 0)):
+            diff_arr = np.diff(np.sort(arr))
+        if diff_arr.size == 0:
+            return True
+        # The spread of the spacings does not depend on their order
+        tol = 1.0e-8 + 1.0e-5 * np.abs(diff_arr).max()
+        return bool(np.ptp(diff_arr) <= tol)
 
 
 class LinearFactory(BatchedFactory):
@@ -1040,15 +1819,15 @@ class LinearFactory(BatchedFactory):
 
     @staticmethod
     def extrapolate(
-        scale_factors: Sequence[float],
-        exp_values: Sequence[float],
+        scale_factors: Union[Sequence[float], np.ndarray],
+        exp_values: Union[Sequence[float], np.ndarray],
         full_output: bool = False,
     ) -> Union[
         float,
         Tuple[
             float,
             Optional[float],
-            List[float],
+            np.ndarray,
             Optional[np.ndarray],
             Callable[[float], float],
         ],
@@ -1078,10 +1857,18 @@ class LinearFactory(BatchedFactory):
             parameters. To compute the zero-noise limit from the Factory
             parameters, use the ``reduce`` method.
         """
+        scale_arr = np.ascontiguousarray(scale_factors, dtype=np.float64)
+        exp_arr = _exp_values_array(exp_values)
+        # The data are checked once, before choosing how to fit them
+        _check_polyfit_data(scale_arr, exp_arr, 1)
+        if not full_output:
+            # The zero-noise limit is the intercept of the closed-form fit
+            linear_fit = _linear_fit(scale_arr, exp_arr, with_cov=False)
+            if linear_fit is not None:
+                return linear_fit[0][1]
+
         # Linear extrapolation is equivalent to a polynomial fit with order=1
-        return PolyFactory.extrapolate(
-            scale_factors, exp_values, 1, full_output
-        )
+        return PolyFactory.extrapolate(scale_arr, exp_arr, 1, full_output)
 
 
 class ExpFactory(BatchedFactory):
@@ -1134,8 +1921,8 @@ class ExpFactory(BatchedFactory):
 
     @staticmethod
     def extrapolate(
-        scale_factors: Sequence[float],
-        exp_values: Sequence[float],
+        scale_factors: Union[Sequence[float], np.ndarray],
+        exp_values: Union[Sequence[float], np.ndarray],
         asymptote: Optional[float] = None,
         avoid_log: bool = False,
         eps: float = 1.0e-6,
@@ -1145,7 +1932,7 @@ class ExpFactory(BatchedFactory):
         Tuple[
             float,
             Optional[float],
-            List[float],
+            np.ndarray,
             Optional[np.ndarray],
             Callable[[float], float],
         ],
@@ -1242,6 +2029,10 @@ class PolyExpFactory(BatchedFactory):
         ExtrapolationWarning: If the extrapolation fit is ill-conditioned.
     """
 
+    # Tolerances of the non-linear fit (used by "mitiq_curve_fit")
+    _FTOL = 1.0e-8
+    _XTOL = 1.0e-8
+
     def __init__(
         self,
         scale_factors: Sequence[float],
@@ -1264,8 +2055,8 @@ class PolyExpFactory(BatchedFactory):
 
     @staticmethod
     def extrapolate(
-        scale_factors: Sequence[float],
-        exp_values: Sequence[float],
+        scale_factors: Union[Sequence[float], np.ndarray],
+        exp_values: Union[Sequence[float], np.ndarray],
         order: int,
         asymptote: Optional[float] = None,
         avoid_log: bool = False,
@@ -1276,7 +2067,7 @@ class PolyExpFactory(BatchedFactory):
         Tuple[
             float,
             Optional[float],
-            List[float],
+            np.ndarray,
             Optional[np.ndarray],
             Callable[[float], float],
         ],
@@ -1349,39 +2140,80 @@ class PolyExpFactory(BatchedFactory):
                 "The order cannot exceed the number"
                 f" of data points minus {1 + shift}."
             )
+        scale_arr = np.ascontiguousarray(scale_factors, dtype=np.float64)
+        exp_arr = np.ascontiguousarray(exp_values, dtype=np.float64)
 
         # Initialize default errors
         zne_error = None
         params_cov = None
 
-        # Deduce "sign" parameter of the exponential ansatz
-        linear_params, _ = mitiq_polyfit(scale_factors, exp_values, deg=1)
+        # Deduce "sign" parameter of the exponential ansatz from the slope of
+        # a linear fit, evaluated in closed form unless it is ill-conditioned
+        linear_fit = _linear_fit(scale_arr, exp_arr, with_cov=False)
+        if linear_fit is not None:
+            linear_params, _ = linear_fit
+        else:
+            linear_params, _ = mitiq_polyfit(scale_arr, exp_arr, deg=1)
         sign = np.sign(-linear_params[0])
 
+        # Note: the coefficients of the polynomial to be exponentiated are
+        # ordered from low to high powers of x.
         def _ansatz_unknown(x: float, *coeffs: float) -> float:
             """Ansatz of generic order with unknown asymptote."""
-            # Coefficients of the polynomial to be exponentiated
-            z_coeffs = coeffs[2:][::-1]
-            return coeffs[0] + coeffs[1] * np.exp(x * np.polyval(z_coeffs, x))
+            asymptote_fit, b_fit, z_fit = coeffs[0], coeffs[1], coeffs[2:]
+            return cast(float, _exp_ansatz(x, asymptote_fit, b_fit, z_fit))
 
         def _ansatz_known(x: float, *coeffs: float) -> float:
             """Ansatz of generic order with known asymptote."""
-            # Coefficients of the polynomial to be exponentiated
-            z_coeffs = coeffs[1:][::-1]
-            return asymptote + coeffs[0] * np.exp(x * np.polyval(z_coeffs, x))
+            known = cast(float, asymptote)
+            return cast(float, _exp_ansatz(x, known, coeffs[0], coeffs[1:]))
+
+        # The Jacobians are only evaluated at the input scale factors, so the
+        # powers of x appearing in their last columns are computed once.
+        powers = np.power.outer(scale_arr, np.arange(1, order + 1))
+
+        def _jac_unknown(x: np.ndarray, *coeffs: float) -> np.ndarray:
+            """Jacobian of the ansatz with unknown asymptote."""
+            jac = np.empty((len(x), order + 2))
+            jac[:, 0] = 1.0
+            jac[:, 1] = _exp_poly(x, coeffs[2:])
+            # Derivatives with respect to the polynomial coefficients
+            np.multiply(coeffs[1] * jac[:, 1:2], powers, out=jac[:, 2:])
+            return jac
+
+        def _jac_known(x: np.ndarray, *coeffs: float) -> np.ndarray:
+            """Jacobian of the ansatz with known asymptote."""
+            jac = np.empty((len(x), order + 1))
+            jac[:, 0] = _exp_poly(x, coeffs[1:])
+            # Derivatives with respect to the polynomial coefficients
+            np.multiply(coeffs[0] * jac[:, 0:1], powers, out=jac[:, 1:])
+            return jac
 
         # CASE 1: asymptote is None.
         if asymptote is None:
             # First guess for the parameters
             p_zero = [0.0, sign, -1.0] + [0.0 for _ in range(order - 1)]
             opt_params, params_cov = mitiq_curve_fit(
-                _ansatz_unknown, scale_factors, exp_values, p_zero
+                _ansatz_unknown,
+                scale_arr,
+                exp_arr,
+                p_zero,
+                jac=_jac_unknown,
+                ftol=PolyExpFactory._FTOL,
+                xtol=PolyExpFactory._XTOL,
             )
             # The zero noise limit is ansatz(0)= asympt + b
             zne_limit = opt_params[0] + opt_params[1]
 
+            # The coefficients are split once, not at each evaluation
+            asymptote_fit, b_fit = opt_params[0], opt_params[1]
+            z_fit = opt_params[2:]
+
             def zne_curve(scale_factor: float) -> float:
-                return _ansatz_unknown(scale_factor, *opt_params)
+                return cast(
+                    float,
+                    _exp_ansatz(scale_factor, asymptote_fit, b_fit, z_fit),
+                )
 
             # Use propagation of errors to calculate zne_error
             if params_cov is not None:
@@ -1408,20 +2240,35 @@ class PolyExpFactory(BatchedFactory):
             # First guess for the parameters
             p_zero = [sign, -1.0] + [0.0 for _ in range(order - 1)]
             opt_params, params_cov = mitiq_curve_fit(
-                _ansatz_known, scale_factors, exp_values, p_zero
+                _ansatz_known,
+                scale_arr,
+                exp_arr,
+                p_zero,
+                jac=_jac_known,
+                ftol=PolyExpFactory._FTOL,
+                xtol=PolyExpFactory._XTOL,
             )
             # The zero noise limit is ansatz(0)= asymptote + b
             zne_limit = asymptote + opt_params[0]
 
+            # The coefficients are split once, not at each evaluation
+            b_fit, z_fit = opt_params[0], opt_params[1:]
+
             def zne_curve(scale_factor: float) -> float:
-                return _ansatz_known(scale_factor, *opt_params)
+                return cast(
+                    float, _exp_ansatz(scale_factor, asymptote, b_fit, z_fit)
+                )
 
             # Use propagation of errors to calculate zne_error
             if params_cov is not None:
                 if params_cov.shape == (order + 1, order + 1):
                     zne_error = np.sqrt(params_cov[0, 0])
 
-            opt_params = [asymptote] + list(opt_params)
+            # Prepend the asymptote to the fitted parameters
+            fit_params = opt_params
+            opt_params = np.empty(order + 2)
+            opt_params[0] = asymptote
+            opt_params[1:] = fit_params
 
             if full_output:
                 return (
@@ -1436,36 +2283,40 @@ class PolyExpFactory(BatchedFactory):
 
         # CASE 3: asymptote is given and "avoid_log" is False
         # Polynomial fit of z(x).
-        shifted_y = [max(sign * (y - asymptote), eps) for y in exp_values]
+        shifted_y = np.maximum(sign * (exp_arr - asymptote), eps)
         zstack = np.log(shifted_y)
 
         # Get coefficients {z_j} of z(x)= z_0 + z_1*x + z_2*x**2...
         # Note: coefficients are ordered from high powers to powers of x
         # Weights "w" are used to compensate for error propagation
         # after the log transformation y --> z
-        z_coefficients, param_cov = mitiq_polyfit(
-            scale_factors,
+        z_coefficients, z_cov = mitiq_polyfit(
+            scale_arr,
             zstack,
             deg=order,
-            weights=np.sqrt(np.abs(shifted_y)),
+            weights=np.sqrt(shifted_y),
         )
         # The zero noise limit is ansatz(0)
-        zne_limit = asymptote + sign * np.exp(z_coefficients[-1])
+        exp_z0 = _exp(z_coefficients[-1])
+        zne_limit = asymptote + sign * exp_z0
+
+        # The polynomial z(x) is evaluated with the Horner scheme
+        z_curve = _polynomial_curve(z_coefficients)
 
         def _zne_curve(scale_factor: float) -> float:
-            return asymptote + sign * np.exp(
-                np.polyval(z_coefficients, scale_factor)
-            )
+            return asymptote + sign * _exp(z_curve(scale_factor))
 
         # Use propagation of errors to calculate zne_error
-        if params_cov is not None:
+        if z_cov is not None:
+            # Order the covariance from low to high powers, as opt_params
+            params_cov = z_cov[::-1, ::-1]
             if params_cov.shape == (order + 1, order + 1):
-                zne_error = np.exp(z_coefficients[-1]) * np.sqrt(
-                    params_cov[order + 1, order + 1]
-                )
+                zne_error = exp_z0 * math.sqrt(params_cov[0, 0])
 
         # Parameters from low order to high order
-        opt_params = [asymptote] + list(z_coefficients[::-1])
+        opt_params = np.empty(order + 2)
+        opt_params[0] = asymptote
+        opt_params[1:] = z_coefficients[::-1]
 
         if full_output:
             return zne_limit, zne_error, opt_params, params_cov, _zne_curve
@@ -1475,7 +2326,12 @@ class PolyExpFactory(BatchedFactory):
 # Keep a log of the optimization process storing:
 # noise value(s), expectation value(s), parameters, and zero limit
 OptimizationHistory = List[
-    Tuple[List[Dict[str, float]], List[float], List[float], float]
+    Tuple[
+        List[Dict[str, float]],
+        Union[List[float], np.ndarray],
+        np.ndarray,
+        float,
+    ]
 ]
 
 
@@ -1553,13 +2409,13 @@ class AdaExpFactory(AdaptiveFactory):
     def next(self) -> Dict[str, float]:
         """Returns a dictionary of parameters to execute a circuit at."""
         # The 1st scale factor is always 1
-        if len(self._instack) == 0:
+        if len(self._scale_arr) == 0:
             return {"scale_factor": 1.0}
         # The 2nd scale factor is self._scale_factor
-        if len(self._instack) == 1:
+        if len(self._scale_arr) == 1:
             return {"scale_factor": self._scale_factor}
         # If asymptote is None we use 2 * scale_factor as third noise parameter
-        if (len(self._instack) == 2) and (self.asymptote is None):
+        if (len(self._scale_arr) == 2) and (self.asymptote is None):
             return {"scale_factor": 2 * self._scale_factor}
 
         with warnings.catch_warnings():
@@ -1570,14 +2426,12 @@ class AdaExpFactory(AdaptiveFactory):
             # The next line avoids warnings after intermediate extrapolations
             self._already_reduced = False
 
-        # Get the most recent fitted parameters from self.history
-        _, _, params, _ = self.history[-1]
-        # The exponent parameter is the 3rd element of params
-        exponent = params[2]
+        # The exponent parameter is the 3rd element of the fitted parameters
+        exponent = self._opt_params[2]  # type: ignore
         # Further noise scale factors are determined with
         # an adaptive rule which depends on self.exponent
         next_scale_factor = min(
-            1.0 + self._SHIFT_FACTOR / np.abs(exponent + self._EPSILON),
+            1.0 + self._SHIFT_FACTOR / abs(exponent + self._EPSILON),
             self.max_scale_factor,
         )
         return {"scale_factor": next_scale_factor}
@@ -1586,17 +2440,17 @@ class AdaExpFactory(AdaptiveFactory):
         """Returns True if all the needed expectation values have been
         computed, else False.
         """
-        if len(self._outstack) != len(self._instack):
+        if len(self._outstack) != len(self._scale_arr):
             raise IndexError(
-                f"The length of 'self._instack' ({len(self._instack)}) "
+                f"The length of 'self._instack' ({len(self._scale_arr)}) "
                 f"and 'self._outstack' ({len(self._outstack)}) must be equal."
             )
         return len(self._outstack) == self._steps
 
     @staticmethod
     def extrapolate(
-        scale_factors: Sequence[float],
-        exp_values: Sequence[float],
+        scale_factors: Union[Sequence[float], np.ndarray],
+        exp_values: Union[Sequence[float], np.ndarray],
         asymptote: Optional[float] = None,
         avoid_log: bool = False,
         eps: float = 1.0e-6,
@@ -1606,7 +2460,7 @@ class AdaExpFactory(AdaptiveFactory):
         Tuple[
             float,
             Optional[float],
-            List[float],
+            np.ndarray,
             Optional[np.ndarray],
             Callable[[float], float],
         ],
@@ -1668,22 +2522,27 @@ class AdaExpFactory(AdaptiveFactory):
         Returns:
             The zero-noise limit.
         """
-        (
-            self._zne_limit,
-            self._zne_error,
-            self._opt_params,
-            self._params_cov,
-            self._zne_curve,
-        ) = self.extrapolate(  # type: ignore
-            self.get_scale_factors(),
-            self.get_expectation_values(),
-            asymptote=self.asymptote,
-            avoid_log=self.avoid_log,
-            full_output=True,
-        )
-        # Update optimization history
-        self.history.append(
-            (self._instack, self._outstack, self._opt_params, self._zne_limit)
+        scale_factors = self.get_scale_factors()
+        exp_values = self.get_expectation_values()
+        options = {"asymptote": self.asymptote, "avoid_log": self.avoid_log}
+        key = _fit_data_key(scale_factors, exp_values, options)
+        # The same data has already been fitted and stored in self.history
+        if key == self._reduce_key:
+            self._already_reduced = True
+            return self._zne_limit  # type: ignore
+
+        zne_limit = self._store_fit_result(
+            self.extrapolate(
+                scale_factors,
+                exp_values,
+                asymptote=self.asymptote,
+                avoid_log=self.avoid_log,
+                full_output=True,
+            )
         )
-        self._already_reduced = True
-        return self._zne_limit
+        self._reduce_key = key
+        # Update optimization history. The expectation values are stored as
+        # a read-only copy, since self._outstack grows at each push.
+        opt_params = self.get_optimal_parameters()
+        self.history.append((self._instack, exp_values, opt_params, zne_limit))
+        return zne_limit
@@ -16,13 +16,16 @@
 """Tests for zero-noise inference and extrapolation methods (factories) with
 classically generated data.
 """
-from typing import Callable, List
+from typing import Callable, Dict, List
+import warnings
 from pytest import mark, raises, warns
 
 import numpy as np
 from numpy.random import RandomState
+from scipy.optimize import curve_fit
 
 import cirq
+from mitiq.collector import batched_executor
 from mitiq.zne.inference import (
     ExtrapolationError,
     ExtrapolationWarning,
@@ -34,6 +37,18 @@ from mitiq.zne.inference import (
     ExpFactory,
     PolyExpFactory,
     AdaExpFactory,
+    mitiq_curve_fit,
+    mitiq_polyfit,
+    use_numba,
+    _exp,
+    _exp_ansatz,
+    _exp_ansatz_loop,
+    _exp_ansatz_numpy,
+    _exp_poly,
+    _fit_data_key,
+    _linear_fit,
+    _polynomial_curve,
+    _vandermonde_pinv,
 )
 
 
@@ -307,6 +322,75 @@ def test_run_sequential_and_batched(factory, batched):
     )
 
 
+def test_batched_factory_complex_exp_values():
+    """Tests that batched factories store and extrapolate complex
+    expectation values."""
+
+    def complex_function(scale_factor: float) -> complex:
+        return 1.0 + 1.0j - scale_factor * (0.1 + 0.2j)
+
+    fac = LinearFactory([1.0, 2.0, 3.0])
+    fac.run_classical(lambda scale_factor: float(scale_factor))
+    assert not np.iscomplexobj(fac.get_expectation_values())
+    fac.run_classical(complex_function)
+    assert np.allclose(
+        fac.get_expectation_values(), [0.9 + 0.8j, 0.8 + 0.6j, 0.7 + 0.4j]
+    )
+    assert np.isclose(fac.reduce(), 1.0 + 1.0j)
+    assert np.isclose(fac.reduce(), 1.0 + 1.0j)
+
+    fac.run(
+        cirq.Circuit(),
+        lambda circuit: 0.5 + 0.5j,
+        scale_noise=lambda circ, _: circ,
+        num_to_average=2,
+    )
+    assert np.allclose(fac.get_expectation_values(), 0.5 + 0.5j)
+    assert np.isclose(fac.reduce(), 0.5 + 0.5j)
+
+
+def test_run_classical_with_batched_function():
+    """Tests that a batched classical function is called only once."""
+    calls = []
+
+    def batched_f(scale_factors: np.ndarray) -> np.ndarray:
+        calls.append(len(scale_factors))
+        return A + B * scale_factors
+
+    fac = LinearFactory(X_VALS)
+    fac.run_classical(batched_f)
+    assert calls == [len(X_VALS)]
+    assert np.allclose(fac.get_expectation_values(), A + B * np.array(X_VALS))
+    assert np.isclose(fac.reduce(), A)
+
+
+def test_run_classical_with_batched_complex_function():
+    """Tests that a batched classical function can return complex
+    expectation values."""
+
+    def batched_f(scale_factors: np.ndarray) -> np.ndarray:
+        return (A + B * scale_factors) * (1.0 + 1.0j)
+
+    fac = LinearFactory(X_VALS)
+    fac.run_classical(batched_f)
+    assert np.iscomplexobj(fac.get_expectation_values())
+    assert np.isclose(fac.reduce(), A * (1.0 + 1.0j))
+
+
+def test_run_batched_with_decorated_executor():
+    fac = LinearFactory(scale_factors=[1.0, 2.0, 3.0])
+    calls = []
+
+    @batched_executor
+    def executor(circuits):
+        calls.append(len(circuits))
+        return [1.0] * len(circuits)
+
+    fac.run(cirq.Circuit(), executor, scale_noise=lambda circ, _: circ)
+    assert calls == [3]
+    assert np.allclose(fac.get_expectation_values(), np.ones(3))
+
+
 @mark.parametrize(
     "factory",
     (
@@ -715,6 +799,127 @@ def test_failing_fit_warnings(fac):
         fac.extrapolate([1, 1, 1, 1], [1.0, 1.0, 1.0, 1.0])
 
 
+def test_exp_poly():
+    """Tests the (possibly compiled) kernel of the exponential ansatzes."""
+    z_coeffs = [-C, -D]
+    expected = np.exp(-C * np.array(X_VALS) - D * np.array(X_VALS) ** 2)
+    assert np.allclose(_exp_poly(np.array(X_VALS), z_coeffs), expected)
+    assert np.isclose(_exp_poly(X_VALS[1], z_coeffs), expected[1])
+    assert np.isscalar(_exp_poly(X_VALS[1], z_coeffs))
+    assert np.allclose(
+        _exp_ansatz(np.array(X_VALS), A, B, z_coeffs), A + B * expected
+    )
+    assert np.isclose(
+        _exp_ansatz(X_VALS[1], A, B, z_coeffs),
+        f_poly_exp_down(X_VALS[1], err=0),
+    )
+    # The fused kernel and its NumPy fallback are equivalent
+    x_array, z_array = np.array(X_VALS), np.array(z_coeffs)
+    assert np.allclose(
+        _exp_ansatz_loop(x_array, A, B, z_array),
+        _exp_ansatz_numpy(x_array, A, B, z_array),
+    )
+
+
+def test_exp():
+    """Tests the exponential function used for scalars and arrays."""
+    assert isinstance(_exp(1.0), float)
+    assert np.isclose(_exp(np.float64(-2.0)), np.exp(-2.0))
+    assert np.allclose(_exp(np.array(X_VALS)), np.exp(X_VALS))
+    # Overflows are handled as in np.exp
+    with warns(RuntimeWarning, match="overflow"):
+        assert _exp(1000.0) == np.inf
+
+
+def test_use_numba():
+    """Tests that the NumPy kernel of the exponential ansatzes is the default
+    and that the kernel compiled with Numba gives the same fits."""
+    from mitiq.zne import inference
+
+    assert inference._exp_ansatz_kernel is _exp_ansatz_numpy
+    exp_values = [f_poly_exp_down(x, err=0) for x in X_VALS]
+    zne_limit = PolyExpFactory.extrapolate(X_VALS, exp_values, order=2)
+    # The global kernel is always restored, so it cannot leak to other tests
+    try:
+        use_numba()
+        assert inference._exp_ansatz_kernel is not _exp_ansatz_numpy
+        assert np.isclose(
+            PolyExpFactory.extrapolate(X_VALS, exp_values, order=2),
+            zne_limit,
+        )
+    except ImportError:  # pragma: no cover
+        assert inference._exp_ansatz_kernel is _exp_ansatz_numpy
+    finally:
+        use_numba(False)
+    assert inference._exp_ansatz_kernel is _exp_ansatz_numpy
+
+
+def test_curve_fit_with_jacobian():
+    """Tests that an analytic Jacobian gives the same fit as a numerical
+    Jacobian."""
+
+    def ansatz(x, a, b, c):
+        return a + b * np.exp(-c * x)
+
+    def jac(x, a, b, c):
+        exp_x = np.exp(-c * x)
+        return np.column_stack((np.ones_like(x), exp_x, -b * x * exp_x))
+
+    exp_values = [f_exp_down(x, err=0) for x in X_VALS]
+    params, cov = mitiq_curve_fit(ansatz, X_VALS, exp_values, [0, 1, 1])
+    params_jac, cov_jac = mitiq_curve_fit(
+        ansatz, X_VALS, exp_values, [0, 1, 1], jac=jac
+    )
+    assert np.allclose(params, [A, B, C], atol=CLOSE_TOL)
+    assert np.allclose(params_jac, params, atol=CLOSE_TOL)
+
+
+def test_curve_fit_covariance_matches_scipy():
+    """Tests that mitiq_curve_fit estimates the covariance matrix and raises
+    errors as scipy.optimize.curve_fit, also for a rank-deficient Jacobian.
+    """
+
+    def ansatz(x, a, b, c):
+        # The parameters b and c are redundant
+        return a + (b + c) * x
+
+    def jac(x, a, b, c):
+        return np.column_stack((np.ones_like(x), x, x))
+
+    seeded_f = apply_seed_to_func(f_lin, SEED)
+    exp_values = [seeded_f(x, err=0.01) for x in X_VALS]
+    params, cov = mitiq_curve_fit(ansatz, X_VALS, exp_values, jac=jac)
+    _, scipy_cov = curve_fit(
+        ansatz, X_VALS, exp_values, jac=jac, method="trf"
+    )
+    assert np.isclose(params[1] + params[2], B, atol=CLOSE_TOL)
+    assert np.all(np.isfinite(cov))
+    assert np.allclose(cov, scipy_cov)
+
+    with raises(TypeError, match="must not exceed the number of data"):
+        mitiq_curve_fit(ansatz, X_VALS[:2], exp_values[:2])
+    with warns(ExtrapolationWarning):
+        _, cov = mitiq_curve_fit(ansatz, X_VALS[:3], exp_values[:3])
+    assert np.all(cov == np.inf)
+
+
+def test_weighted_polyfit_matches_numpy():
+    """Tests that mitiq_polyfit reproduces numpy.polyfit and that it raises
+    an ExtrapolationWarning instead of a RankWarning."""
+    exp_values = [f_non_lin(x, err=0.01) for x in X_VALS]
+    weights = np.linspace(0.5, 2.0, len(X_VALS))
+    params, cov = mitiq_polyfit(X_VALS, exp_values, 2, weights=weights)
+    np_params, np_cov = np.polyfit(
+        X_VALS, exp_values, 2, w=weights, cov=True
+    )
+    assert np.allclose(params, np_params)
+    assert np.allclose(cov, np_cov)
+    with warns(ExtrapolationWarning) as record:
+        _, cov = mitiq_polyfit([1.0, 1.0, 1.0], [1.0, 2.0, 3.0], 1)
+    assert cov is None
+    assert all(w.category is ExtrapolationWarning for w in record)
+
+
 def test_adaptive_factory_max_iteration_warnings():
     """Test that the correct warning is raised beyond the iteration limit."""
     fac = AdaExpFactory(steps=10)
@@ -779,6 +984,169 @@ def test_push_after_already_reduced_warning():
     assert np.isclose(3.0, fac.reduce())
 
 
+@mark.parametrize("factory", (LinearFactory, RichardsonFactory))
+def test_reduce_fast(factory):
+    """Tests that reduce_fast only evaluates the zero-noise limit."""
+    fac = factory(X_VALS)
+    fac.run_classical(f_lin)
+    zne_limit = fac.reduce_fast()
+    assert np.isclose(zne_limit, fac.extrapolate(X_VALS, fac._outstack))
+    assert np.isclose(fac.get_zero_noise_limit(), zne_limit)
+    with raises(ValueError, match="Data is either ill-defined or not enough"):
+        fac.get_extrapolation_curve()
+    # reduce fits again to compute all the results
+    assert np.isclose(fac.reduce(), zne_limit)
+    assert np.isclose(fac.get_extrapolation_curve()(0.0), zne_limit)
+    # and reduce_fast now reuses them
+    assert np.isclose(fac.reduce_fast(), zne_limit)
+    assert fac.get_extrapolation_curve() is not None
+
+
+def test_push_after_run_classical():
+    """Tests that new data can be pushed into the preallocated expectation
+    values of a batched factory."""
+    fac = LinearFactory([1.0, 2.0])
+    fac.run_classical(lambda scale_factor: 2.0 * scale_factor)
+    assert isinstance(fac._outstack, np.ndarray)
+    fac.push({"scale_factor": 3.0}, 6.0)
+    assert np.allclose(fac.get_expectation_values(), [2.0, 4.0, 6.0])
+    assert np.allclose(fac.get_scale_factors(), [1.0, 2.0, 3.0])
+    assert not fac.get_expectation_values().flags.writeable
+
+
+def test_push_stores_input_parameters_as_arrays():
+    """Tests that pushed input parameters are stored as arrays and that
+    inconsistent input parameters are rejected."""
+    fac = LinearFactory([1, 2])
+    fac.push({"scale_factor": 1.0, "shots": 100}, 1.0)
+    fac.push({"scale_factor": 2.0, "shots": 200}, 2.0)
+    assert np.allclose(fac.get_scale_factors(), [1.0, 2.0])
+    assert not fac.get_scale_factors().flags.writeable
+    assert fac._instack == [
+        {"scale_factor": 1.0, "shots": 100},
+        {"scale_factor": 2.0, "shots": 200},
+    ]
+    assert fac._get_keyword_args(num_to_average=2) == [
+        {"shots": 100},
+        {"shots": 100},
+        {"shots": 200},
+        {"shots": 200},
+    ]
+    with raises(ValueError, match=r"must be present in either all or none"):
+        fac.push({"scale_factor": 3.0}, 3.0)
+    with raises(ValueError, match=r"must contain the key 'scale_factor'"):
+        fac.push({"shots": 300}, 3.0)
+
+
+def test_push_keeps_extra_executor_parameters():
+    """Tests that input parameters other than "scale_factor" and "shots" are
+    stored and passed to the executor."""
+    fac = LinearFactory([1, 2])
+    fac.push({"scale_factor": 1.0, "shots": 100}, 1.0)
+    fac.push({"scale_factor": 2.0, "shots": 200, "seed": 7}, 2.0)
+    assert fac._instack == [
+        {"scale_factor": 1.0, "shots": 100},
+        {"scale_factor": 2.0, "shots": 200, "seed": 7},
+    ]
+    assert fac._get_keyword_args(num_to_average=1) == [
+        {"shots": 100},
+        {"shots": 200, "seed": 7},
+    ]
+    assert np.allclose(fac.get_scale_factors(), [1.0, 2.0])
+    fac.reset()
+    assert fac._instack == []
+
+
+def test_adaptive_factory_with_extra_executor_parameter():
+    """Tests that an adaptive factory can pass extra parameters to the
+    executor."""
+
+    class SeededAdaExpFactory(AdaExpFactory):
+        def next(self) -> Dict[str, float]:
+            params = super().next()
+            params["seed"] = len(self.get_scale_factors())
+            return params
+
+    seeds = []
+
+    def executor(scale_factor: float, seed: int) -> float:
+        seeds.append(seed)
+        return f_exp_down(scale_factor)
+
+    fac = SeededAdaExpFactory(steps=4, asymptote=A)
+    fac.run_classical(executor)
+    assert seeds == [0, 1, 2, 3]
+    assert [params["seed"] for params in fac._instack] == seeds
+    assert np.isclose(fac.reduce(), f_exp_down(0.0), atol=CLOSE_TOL)
+
+
+def test_store_fit_result_expects_full_output():
+    """Tests that only the full output of an extrapolation can be stored."""
+    fac = AdaExpFactory(steps=4, asymptote=A)
+    fac.run_classical(f_exp_down)
+    zne_limit = fac.reduce()
+    assert fac.history[-1][3] == zne_limit
+    assert np.array_equal(fac.history[-1][2], fac.get_optimal_parameters())
+    with raises(TypeError, match="Expected the full output"):
+        fac._store_fit_result(zne_limit)
+
+
+def test_reduce_is_not_repeated_for_the_same_data():
+    """Tests that reduce does not fit again data which was already fitted."""
+    fac = PolyFactory(X_VALS, order=2)
+    fac.run_classical(apply_seed_to_func(f_non_lin, SEED))
+    zne_limit = fac.reduce()
+
+    def failing_extrapolate(*args, **kwargs):
+        raise AssertionError("The fit should not be repeated.")
+
+    extrapolate = fac.extrapolate
+    fac.extrapolate = failing_extrapolate
+    assert fac.reduce() == zne_limit
+
+    # Changing the options or the data triggers a new fit
+    fac._options["order"] = 1
+    with raises(AssertionError, match="should not be repeated"):
+        fac.reduce()
+    fac.extrapolate = extrapolate
+    assert fac.reduce() != zne_limit
+
+
+def test_ada_exp_reduce_is_not_repeated_for_the_same_data():
+    """Tests that the reduce method of AdaExpFactory does not fit again data
+    which was already fitted, nor logs it again in the history."""
+    fac = AdaExpFactory(steps=4, scale_factor=2.0, asymptote=None)
+    fac.run_classical(apply_seed_to_func(f_exp_down, SEED))
+    num_fits = len(fac.history)
+    zne_limit = fac.reduce()
+    assert len(fac.history) == num_fits + 1
+    assert fac.reduce() == zne_limit
+    assert len(fac.history) == num_fits + 1
+
+    # Changing the options triggers a new fit
+    fac.avoid_log = True
+    fac.asymptote = 0.5
+    assert fac.reduce() != zne_limit
+    assert len(fac.history) == num_fits + 2
+
+
+def test_ada_exp_factory_history():
+    """Tests that each entry of the history of AdaExpFactory stores the data
+    used by the corresponding fit."""
+    fac = AdaExpFactory(steps=5, scale_factor=2.0, asymptote=None)
+    fac.run_classical(apply_seed_to_func(f_exp_down, SEED))
+    fac.reduce()
+    for instack, exp_values, _, zne_limit in fac.history:
+        assert len(instack) == len(exp_values)
+        scale_factors = [params["scale_factor"] for params in instack]
+        with warnings.catch_warnings():
+            # The first fit has as many data points as parameters
+            warnings.simplefilter("ignore", ExtrapolationWarning)
+            extrapolated = fac.extrapolate(scale_factors, exp_values)
+        assert np.isclose(extrapolated, zne_limit)
+    assert [len(entry[1]) for entry in fac.history] == [3, 4, 5]
+
+
 def test_full_output_keyword():
     """Tests the full_output keyword in extrapolate method."""
     zne_limit = LinearFactory.extrapolate([1, 2], [1, 2])
@@ -826,6 +1194,264 @@ def test_full_output_keyword_cov_std():
     assert np.isclose(zne_curve(3), 9.0)
 
 
+@mark.parametrize("order", [1, 2, 3])
+def test_poly_extr_matches_polyfit(order):
+    """Tests that polynomial fits reproduce numpy.polyfit and that the
+    cached Vandermonde pseudoinverse is reused for equal scale factors."""
+    exp_values = [f_non_lin(x, err=0.01) for x in X_VALS]
+    coeffs, cov = np.polyfit(X_VALS, exp_values, order, cov=True)
+    hits = _vandermonde_pinv.cache_info().hits
+    for _ in range(2):
+        (
+            zne_limit,
+            zne_error,
+            opt_params,
+            params_cov,
+            zne_curve,
+        ) = PolyFactory.extrapolate(
+            X_VALS, exp_values, order, full_output=True
+        )
+        assert np.isclose(zne_limit, coeffs[-1])
+        assert np.isclose(zne_curve(1.5), np.polyval(coeffs, 1.5))
+        assert np.allclose(zne_curve(X_VALS), np.polyval(coeffs, X_VALS))
+        assert np.allclose(opt_params, coeffs)
+        assert np.allclose(params_cov, cov)
+        assert np.isclose(zne_error, np.sqrt(cov[order, order]))
+    # Linear fits are evaluated in closed form, without the pseudoinverse
+    if order > 1:
+        assert _vandermonde_pinv.cache_info().hits > hits
+
+
+def test_richardson_lagrange_weights():
+    """Tests that the Lagrange weights of RichardsonFactory reproduce the
+    zero-noise limit of the interpolating polynomial."""
+    exp_values = [f_non_lin(x, err=0.01) for x in X_VALS]
+    weights = RichardsonFactory._lagrange_weights_at_zero(tuple(X_VALS))
+    assert np.isclose(np.sum(weights), 1.0)
+    zne_limit = RichardsonFactory.extrapolate(X_VALS, exp_values)
+    assert np.isclose(zne_limit, weights @ exp_values)
+    assert np.isclose(
+        zne_limit,
+        RichardsonFactory.extrapolate(X_VALS, exp_values, full_output=True)[0],
+    )
+    # Repeated scale factors make the interpolation problem singular
+    assert RichardsonFactory._lagrange_weights_at_zero((1.0, 1.0, 2.0)) is None
+
+
+def test_high_order_poly_extr_is_well_conditioned():
+    """Tests that a high order polynomial interpolation of many distinct
+    scale factors does not raise an ExtrapolationWarning."""
+    exp_values = [f_exp_down(x, err=0) for x in UNIFORM_X]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ExtrapolationWarning)
+        zne_limit = RichardsonFactory.extrapolate(UNIFORM_X, exp_values)
+    assert np.isclose(zne_limit, f_exp_down(0, err=0), atol=1.0e-3)
+
+
+@mark.parametrize(
+    "scale_factors, order",
+    [([1, 1, 2, 2, 3, 3], 5), ([1, 1, 1, 2, 2, 2], 3), ([1, 1, 2], 2)],
+)
+def test_rank_deficient_poly_extr_matches_polyfit(scale_factors, order):
+    """Tests that polynomial fits of repeated scale factors, for which the
+    Vandermonde matrix is rank-deficient, reproduce numpy.polyfit and raise
+    an ExtrapolationWarning."""
+    # Repeated scale factors have different expectation values
+    exp_values = [
+        f_exp_down(x, err=0) + 0.01 * i for i, x in enumerate(scale_factors)
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", np.RankWarning)
+        expected = np.polyfit(scale_factors, exp_values, order)[-1]
+    with warns(ExtrapolationWarning):
+        zne_limit = PolyFactory.extrapolate(scale_factors, exp_values, order)
+    assert np.isclose(zne_limit, expected)
+    with warns(ExtrapolationWarning):
+        zne_limits = PolyFactory.extrapolate_batch(
+            scale_factors, np.column_stack([exp_values] * 2), order
+        )
+    assert np.allclose(zne_limits, expected)
+    if order == len(scale_factors) - 1:
+        with warns(ExtrapolationWarning):
+            zne_limit = RichardsonFactory.extrapolate(
+                scale_factors, exp_values
+            )
+        assert np.isclose(zne_limit, expected)
+
+
+@mark.parametrize("order", [1, 2])
+def test_poly_extr_bad_data(order):
+    """Tests that inconsistent data raise the same errors as numpy.polyfit
+    in all the paths of PolyFactory.extrapolate."""
+    for full_output in (False, True):
+        with raises(TypeError, match="expected non-empty vector for x"):
+            PolyFactory.extrapolate([], [], order, full_output)
+        with raises(TypeError, match="expected x and y to have same length"):
+            PolyFactory.extrapolate([1, 2, 3], [1, 2], order, full_output)
+
+
+def test_polyfit_bad_data():
+    """Tests that mitiq_polyfit raises the same errors as numpy.polyfit."""
+    with raises(TypeError, match="expected non-empty vector for x"):
+        mitiq_polyfit([], [], 1)
+    with raises(TypeError, match="expected x and y to have same length"):
+        mitiq_polyfit([1, 2, 3], [1, 2], 1)
+    with raises(ValueError, match="expected deg >= 0"):
+        mitiq_polyfit([1, 2, 3], [1, 2, 3], -1)
+
+
+# Complex expectation values, which numpy.polyfit supports
+COMPLEX_X = [1.0, 2.0, 3.0, 4.0]
+COMPLEX_Y = [1.0 + 1.0j, 0.9 + 0.8j, 0.8 + 0.6j, 0.75 + 0.55j]
+
+
+def test_polyfit_complex_exp_values():
+    """Tests that mitiq_polyfit fits complex data as numpy.polyfit does."""
+    opt_params, params_cov = mitiq_polyfit(COMPLEX_X, COMPLEX_Y, 1)
+    expected_params, expected_cov = np.polyfit(
+        COMPLEX_X, COMPLEX_Y, 1, cov="unscaled"
+    )
+    residuals = np.array(COMPLEX_Y) - np.polyval(expected_params, COMPLEX_X)
+    expected_cov *= np.vdot(residuals, residuals).real / 2
+    assert np.allclose(opt_params, expected_params)
+    assert np.allclose(params_cov, expected_cov)
+
+
+@mark.parametrize("coeffs", ([0.5 - 1.0j, 2.0 + 0.5j], [1.0j, -0.5, 2.0]))
+def test_polynomial_curve_complex_coeffs(coeffs):
+    """Tests the Horner evaluation of polynomials with complex coefficients
+    for scalar and array inputs."""
+    curve = _polynomial_curve(coeffs)
+    assert np.isclose(curve(1.5), np.polyval(coeffs, 1.5))
+    x_vals = np.array(COMPLEX_X)
+    assert np.allclose(curve(x_vals), np.polyval(coeffs, x_vals))
+
+
+@mark.parametrize(
+    "num_points, order, extrapolate",
+    (
+        (4, 2, lambda x, y: PolyFactory.extrapolate(x, y, 2, True)),
+        (4, 1, lambda x, y: LinearFactory.extrapolate(x, y, True)),
+        (3, 2, lambda x, y: RichardsonFactory.extrapolate(x, y, True)),
+    ),
+)
+def test_poly_extr_complex_exp_values(num_points, order, extrapolate):
+    """Tests the full output of polynomial fits of complex expectation
+    values against numpy.polyfit."""
+    x_vals, y_vals = COMPLEX_X[:num_points], COMPLEX_Y[:num_points]
+    zne_limit, _, opt_params, _, zne_curve = extrapolate(x_vals, y_vals)
+    expected_params = np.polyfit(x_vals, y_vals, order)
+    assert np.allclose(opt_params, expected_params)
+    assert np.isclose(zne_limit, expected_params[-1])
+    assert np.isclose(zne_curve(2.5), np.polyval(expected_params, 2.5))
+
+
+def test_fake_nodes_extr_complex_exp_values():
+    """Tests FakeNodesFactory with complex expectation values."""
+    zne_limit = FakeNodesFactory.extrapolate(COMPLEX_X[:3], COMPLEX_Y[:3])
+    assert np.isclose(zne_limit, 1.04142135623731 + 1.0828427124746198j)
+
+
+def test_fit_data_key_complex_exp_values():
+    """Tests that complex expectation values have a fit data key which
+    differs from the key of their real parts."""
+    x_vals = np.array(COMPLEX_X)
+    y_vals = np.array(COMPLEX_Y)
+    key = _fit_data_key(x_vals, y_vals, {})
+    assert key == _fit_data_key(x_vals, y_vals.copy(), {})
+    assert key != _fit_data_key(x_vals, y_vals.real, {})
+
+
+def test_richardson_extr_complex_exp_values():
+    """Tests the Lagrange weights path of RichardsonFactory with complex
+    expectation values."""
+    zne_limit = RichardsonFactory.extrapolate(COMPLEX_X[:3], COMPLEX_Y[:3])
+    expected_params = np.polyfit(COMPLEX_X[:3], COMPLEX_Y[:3], 2)
+    assert np.isclose(zne_limit, expected_params[-1])
+    assert np.isclose(zne_limit, 1.1 + 1.2j)
+
+
+def test_linear_extr_complex_exp_values():
+    """Tests the closed-form linear fit of complex expectation values."""
+    zne_limit = LinearFactory.extrapolate(COMPLEX_X[:3], COMPLEX_Y[:3])
+    assert np.isclose(zne_limit, 1.1 + 1.2j)
+    opt_params, params_cov = _linear_fit(
+        np.array(COMPLEX_X), np.array(COMPLEX_Y)
+    )
+    expected_params, expected_cov = mitiq_polyfit(COMPLEX_X, COMPLEX_Y, 1)
+    assert np.allclose(opt_params, expected_params)
+    assert np.allclose(params_cov, expected_cov)
+
+
+def test_richardson_extr_bad_data():
+    """Tests that inconsistent data raise the same errors as numpy.polyfit
+    in both the Lagrange weights and the general paths of RichardsonFactory.
+    """
+    for full_output in (False, True):
+        with raises(ValueError, match="expected deg >= 0"):
+            RichardsonFactory.extrapolate([], [], full_output)
+        with raises(TypeError, match="expected x and y to have same length"):
+            RichardsonFactory.extrapolate([1, 2, 3], [1, 2], full_output)
+
+
+def test_linear_extr_bad_data():
+    """Tests that inconsistent data raise the same errors as numpy.polyfit
+    in both the closed-form and the general paths of LinearFactory."""
+    for full_output in (False, True):
+        with raises(TypeError, match="expected non-empty vector for x"):
+            LinearFactory.extrapolate([], [], full_output)
+        with raises(TypeError, match="expected x and y to have same length"):
+            LinearFactory.extrapolate([1, 2, 3], [1, 2], full_output)
+
+
+@mark.parametrize("order", [1, 2, 3])
+def test_poly_extrapolate_batch(order):
+    """Tests that PolyFactory.extrapolate_batch is equivalent to many calls
+    of PolyFactory.extrapolate."""
+    exp_values = np.column_stack(
+        [[f_non_lin(x, err=0.01) for x in X_VALS] for _ in range(5)]
+    )
+    zne_limits = PolyFactory.extrapolate_batch(X_VALS, exp_values, order)
+    assert zne_limits.shape == (5,)
+    for zne_limit, column in zip(zne_limits, exp_values.T):
+        assert np.isclose(
+            zne_limit, PolyFactory.extrapolate(X_VALS, column, order)
+        )
+    with raises(ValueError, match=r"must be a 2D array with one row"):
+        PolyFactory.extrapolate_batch(X_VALS, exp_values[1:], order)
+
+
+@mark.parametrize("order", [1, 2])
+def test_poly_exp_with_asympt_zne_std(order):
+    """Tests the covariance and the error propagation of the log-linear fit
+    of PolyExpFactory, when the asymptote is known."""
+    seeded_f = apply_seed_to_func(f_poly_exp_down, SEED)
+    exp_values = [seeded_f(x, err=0.001) for x in X_VALS]
+    shifted = np.array(exp_values) - A
+    coeffs, cov = np.polyfit(
+        X_VALS, np.log(shifted), order, w=np.sqrt(shifted), cov="unscaled"
+    )
+    # np.polyfit uses a different normalization factor for the covariance
+    dof = len(X_VALS) - (order + 1)
+    residuals = np.sqrt(shifted) * (
+        np.log(shifted) - np.polyval(coeffs, X_VALS)
+    )
+    cov *= residuals @ residuals / dof
+    (
+        zne_limit,
+        zne_std,
+        opt_params,
+        params_cov,
+        _,
+    ) = PolyExpFactory.extrapolate(
+        X_VALS, exp_values, order, asymptote=A, full_output=True
+    )
+    assert np.isclose(zne_limit, A + np.exp(coeffs[-1]))
+    assert np.allclose(opt_params, np.concatenate(([A], coeffs[::-1])))
+    assert np.allclose(params_cov, cov[::-1, ::-1])
+    assert np.isclose(zne_std, np.exp(coeffs[-1]) * np.sqrt(cov[-1, -1]))
+
+
 def test_params_cov_and_zne_std():
     """Tests the variance of the parametes and of the zne are produced."""
     x_values = [0, 0, 1]
@@ -890,6 +1516,12 @@ def test_get_methods_of_factories():
     assert np.allclose(fac.get_scale_factors(), x_values)
     assert np.allclose(fac.get_zero_noise_limit(), zne_reduce)
     assert np.allclose(fac.get_zero_noise_limit_error(), 1.0)
+    # Array getters return read-only views of the stored data
+    assert not fac.get_optimal_parameters().flags.writeable
+    assert not fac.get_parameters_covariance().flags.writeable
+    assert np.shares_memory(
+        fac.get_parameters_covariance(), fac.get_parameters_covariance()
+    )
 
 
 @mark.parametrize(
@@ -973,8 +1605,43 @@ def test__fakenodes_scale_factors_equally_spaced():
         _ = FakeNodesFactory(X_VALS).extrapolate(X_VALS, y_vals)
 
 
+@mark.parametrize(
+    "scale_factors, expected",
+    [
+        ([1.0, 2.0, 3.0], True),
+        ([3.0, 2.0, 1.0], True),
+        ([1.0, 3.0, 2.0], True),
+        ([1.0, 2.0, 4.0], False),
+        ([1.0, 3.0, 2.5], False),
+    ],
+)
+def test_fakenodes_is_equally_spaced(scale_factors, expected):
+    """Tests the equal spacing check of FakeNodesFactory, also for
+    sequences which are not sorted."""
+    assert FakeNodesFactory._is_equally_spaced(scale_factors) is expected
+
+
+def test_fakenodes_extrapolation_curve():
+    """Tests that the curve returned by FakeNodesFactory is evaluated in
+    the space of the real scale factors."""
+    scale_factors = [1.0, 2.0, 3.0, 4.0]
+    exp_values = [f_lin(x, err=0) for x in scale_factors]
+    zne_curve = FakeNodesFactory.extrapolate(
+        scale_factors, exp_values, full_output=True
+    )[-1]
+    assert np.allclose(zne_curve(np.array(scale_factors)), exp_values)
+    assert np.isclose(zne_curve(2.5), f_lin(2.5, err=0))
+
+
 def test_map_to_fakenodes():
     """Test the fake nodes map in FakeNodesFactory."""
     fac = FakeNodesFactory(UNIFORM_X)
     test_argument = 1.0
     assert np.isclose(fac._map_to_fake_nodes(1.0, 2.0, test_argument), 1.0,)
+    # Sequences are mapped element-wise
+    fake_nodes = fac._map_to_fake_nodes(UNIFORM_X, 0.0, 6.0)
+    assert isinstance(fake_nodes, np.ndarray)
+    assert np.allclose(
+        fake_nodes, [fac._map_to_fake_nodes(x, 0.0, 6.0) for x in UNIFORM_X]
+    )
+    assert np.isclose(fac._map_to_fake_nodes(3, 0.0, 6.0), 3.0)